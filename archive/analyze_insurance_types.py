@@ -8,75 +8,141 @@ This script analyzes all example files to extract:
 3. Field types and structures
 """
 
-import json
 import os
+import orjson
 from pathlib import Path
 from typing import Dict, List, Any, Set
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+def _analyze_one(example_file: Path):
+    """Analyze a single example file in isolation (safe to run in a worker process)."""
+    insurance_types = set()
+    field_structures = {}
+    field_types = {}
+
+    try:
+        # orjson parses the raw bytes directly - much faster than json.load
+        # and skips the TextIOWrapper decoding layer entirely
+        data = orjson.loads(example_file.read_bytes())
+
+        # Handle different response structures
+        response = data.get('response', {})
+
+        # Case 1: Response is a list with insurance type objects
+        if isinstance(response, list):
+            for item in response:
+                if isinstance(item, dict) and 'id' in item:
+                    insurance_type = item['id']
+                    insurance_types.add(insurance_type)
+
+                    # Analyze the data array
+                    data_array = item.get('data', [])
+                    if isinstance(data_array, list):
+                        for data_item in data_array:
+                            if isinstance(data_item, dict):
+                                analyze_fields(data_item, insurance_type, field_structures, field_types)
+
+        # Case 2: Response is a direct object (for other entity types)
+        elif isinstance(response, dict):
+            # This might be for savings/money entities
+            entity = data.get('entity', 'Unknown')
+            if entity not in ['vehicleUnitedEntity']:
+                analyze_fields(response, entity, field_structures, field_types)
+
+    except Exception as e:
+        print(f"⚠️  Warning: Could not process {example_file.name}: {e}")
+
+    return insurance_types, field_structures, field_types
+
+def _merge_field_tables(target: Dict, source: Dict):
+    """Merge one worker's {insurance_type: {field: set}} table into the main one."""
+    for insurance_type, fields in source.items():
+        merged = target.setdefault(insurance_type, {})
+        for field_name, values in fields.items():
+            existing = merged.get(field_name)
+            if existing is None:
+                merged[field_name] = values
+            else:
+                existing |= values
 
 def analyze_insurance_types():
     """Analyze all example files to extract insurance types and their structures."""
     examples_path = Path("D:/Mock_JSON/data/examples")
-    
-    # Track insurance types and their fields
+
+    # Track insurance types and their fields; plain dicts populated on
+    # demand avoid defaultdict's per-miss factory call in the hot loop
     insurance_types = set()
-    field_structures = defaultdict(lambda: defaultdict(set))
-    field_types = defaultdict(lambda: defaultdict(set))
-    
-    # Process all JSON files
-    for example_file in examples_path.glob("*.json"):
-        try:
-            with open(example_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Handle different response structures
-            response = data.get('response', {})
-            
-            # Case 1: Response is a list with insurance type objects
-            if isinstance(response, list):
-                for item in response:
-                    if isinstance(item, dict) and 'id' in item:
-                        insurance_type = item['id']
-                        insurance_types.add(insurance_type)
-                        
-                        # Analyze the data array
-                        data_array = item.get('data', [])
-                        if isinstance(data_array, list):
-                            for data_item in data_array:
-                                if isinstance(data_item, dict):
-                                    analyze_fields(data_item, insurance_type, field_structures, field_types)
-            
-            # Case 2: Response is a direct object (for other entity types)
-            elif isinstance(response, dict):
-                # This might be for savings/money entities
-                entity = data.get('entity', 'Unknown')
-                if entity not in ['vehicleUnitedEntity']:
-                    analyze_fields(response, entity, field_structures, field_types)
-                    
-        except Exception as e:
-            print(f"⚠️  Warning: Could not process {example_file.name}: {e}")
-    
+    field_structures = {}
+    field_types = {}
+
+    # iterdir with a suffix check skips glob's per-name fnmatch, and the
+    # materialized list gives a predictable chunk size for the executor
+    example_files = [p for p in examples_path.iterdir() if p.suffix == '.json']
+    chunksize = max(1, len(example_files) // ((os.cpu_count() or 1) * 4))
+
+    # Each file is analyzed independently, so the parse-heavy work is spread
+    # across processes and only the cheap set/dict merges run in the parent
+    with ProcessPoolExecutor() as executor:
+        for types_found, structures, types in executor.map(_analyze_one, example_files, chunksize=chunksize):
+            insurance_types |= types_found
+            _merge_field_tables(field_structures, structures)
+            _merge_field_tables(field_types, types)
+
     return insurance_types, field_structures, field_types
 
+# JSON values only ever carry a handful of types; caching their names skips
+# the type(...).__name__ attribute access on every field visited
+_TYPE_NAMES = {
+    str: 'str',
+    int: 'int',
+    float: 'float',
+    bool: 'bool',
+    type(None): 'NoneType',
+    dict: 'dict',
+    list: 'list',
+}
+
 def analyze_fields(obj: Dict[str, Any], insurance_type: str, field_structures: Dict, field_types: Dict):
-    """Recursively analyze fields in an object."""
-    for field_name, field_value in obj.items():
-        # Track field presence
-        field_structures[insurance_type][field_name].add(type(field_value).__name__)
-        
-        # Track field types
-        if isinstance(field_value, dict):
-            field_types[insurance_type][field_name].add('object')
-            # Recursively analyze nested objects
-            analyze_fields(field_value, insurance_type, field_structures, field_types)
-        elif isinstance(field_value, list):
-            field_types[insurance_type][field_name].add('array')
-            # Analyze array items
-            for item in field_value:
-                if isinstance(item, dict):
-                    analyze_fields(item, insurance_type, field_structures, field_types)
-        else:
-            field_types[insurance_type][field_name].add(type(field_value).__name__)
+    """Analyze fields in an object, walking nested dicts/lists iteratively.
+
+    An explicit stack replaces recursion so deeply nested responses neither
+    pay a Python frame per nested object nor risk hitting the recursion limit.
+    """
+    # Bind the per-type tables once instead of re-indexing on every field
+    structures = field_structures.setdefault(insurance_type, {})
+    types = field_types.setdefault(insurance_type, {})
+
+    type_names = _TYPE_NAMES
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        for field_name, field_value in current.items():
+            # JSON data only ever holds exact dict/list instances, so the
+            # identity check beats isinstance's MRO walk in this hot loop
+            value_type = type(field_value)
+            type_name = type_names.get(value_type) or value_type.__name__
+
+            # Track field presence
+            seen = structures.get(field_name)
+            if seen is None:
+                seen = structures[field_name] = set()
+            seen.add(type_name)
+
+            # Track field types
+            kinds = types.get(field_name)
+            if kinds is None:
+                kinds = types[field_name] = set()
+            if value_type is dict:
+                kinds.add('object')
+                stack.append(field_value)
+            elif value_type is list:
+                kinds.add('array')
+                for item in field_value:
+                    if type(item) is dict:
+                        stack.append(item)
+            else:
+                kinds.add(type_name)
 
 def print_analysis(insurance_types: Set[str], field_structures: Dict, field_types: Dict):
     """Print the analysis results."""
@@ -124,13 +190,17 @@ def print_analysis(insurance_types: Set[str], field_structures: Dict, field_type
     
     print(f"\n📋 Total unique fields across all insurance types: {len(all_fields)}")
     print("\nField presence by insurance type:")
-    
+
+    # Invert once - walk each type's field table instead of probing every
+    # (field, insurance_type) pair; types are visited in sorted order so the
+    # per-field lists come out already sorted
+    presence = defaultdict(list)
+    for insurance_type in sorted(insurance_types):
+        for field_name in field_structures.get(insurance_type, ()):
+            presence[field_name].append(insurance_type)
+
     for field_name in sorted(all_fields):
-        present_in = []
-        for insurance_type in sorted(insurance_types):
-            if field_name in field_structures.get(insurance_type, {}):
-                present_in.append(insurance_type)
-        
+        present_in = presence.get(field_name)
         if present_in:
             print(f"  {field_name}: {', '.join(present_in)}")
 
@@ -149,8 +219,11 @@ def main():
         'field_types': {k: {fk: list(fv) for fk, fv in v.items()} for k, v in field_types.items()}
     }
     
-    with open('insurance_analysis_results.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    # orjson emits UTF-8 bytes directly, so no text-mode file or separate
+    # ensure_ascii handling is needed
+    Path('insurance_analysis_results.json').write_bytes(
+        orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    )
     
     print(f"\n💾 Detailed results saved to: insurance_analysis_results.json")
 
@@ -1,9 +1,27 @@
+from collections import OrderedDict
+
+
 class SchemaCache:
-    def __init__(self):
-        self._cache = {}
+    """Bounded schema cache with lru_cache-style eviction.
+
+    Keeps the set_schema/get_schema API but caps the number of retained
+    schemas, evicting the least recently used entry once full so long-running
+    processes don't grow without bound.
+    """
+
+    def __init__(self, maxsize=128):
+        self._cache = OrderedDict()
+        self._maxsize = maxsize
 
     def set_schema(self, key, schema):
-        self._cache[key] = schema
+        cache = self._cache
+        cache[key] = schema
+        cache.move_to_end(key)
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
 
     def get_schema(self, key):
-        return self._cache.get(key) 
\ No newline at end of file
+        schema = self._cache.get(key)
+        if schema is not None:
+            self._cache.move_to_end(key)
+        return schema
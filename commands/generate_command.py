@@ -9,6 +9,7 @@ pattern for generating mock data for specific insurance types.
 from typing import List, Dict, Any
 from .base_command import BaseCommand
 from .generator_context import GeneratorContext
+from exceptions import InsuranceTypeNotFoundError
 
 
 class GenerateCommand(BaseCommand):
@@ -46,17 +47,18 @@ class GenerateCommand(BaseCommand):
         if errors:
             raise ValueError(f"Validation failed: {', '.join(errors)}")
         
-        # Get the factory from context
-        factory = context.get_factory()
+        # Get the (cached) generator for the insurance type; the lookup
+        # itself reports unsupported types, so validate() no longer probes
+        # the registry separately
+        try:
+            generator = context.get_or_create_generator(self.insurance_type)
+        except InsuranceTypeNotFoundError as e:
+            raise ValueError(f"Validation failed: Unsupported insurance type: {self.insurance_type}") from e
         
-        # Create generator for the insurance type
-        generator = factory.create_generator(self.insurance_type)
-        
-        # Generate records
-        records = []
-        for _ in range(self.num_records):
-            record = generator.generate_record()
-            records.append(record)
+        # Generate records; binding the method once and using a comprehension
+        # lets CPython pre-size the list and skips a per-record attribute lookup
+        generate = generator.generate_record
+        records = [generate() for _ in range(self.num_records)]
         
         # Save records to context
         context.save_records(self.insurance_type, records)
@@ -74,12 +76,9 @@ class GenerateCommand(BaseCommand):
             List of validation error messages (empty if valid)
         """
         errors = []
-        
-        # Check if insurance type is supported
-        factory = context.get_factory()
-        if not factory.is_supported(self.insurance_type):
-            errors.append(f"Unsupported insurance type: {self.insurance_type}")
-        
+
+        # Insurance-type support is checked once by the generator lookup in
+        # execute(), so only the record count is validated here
         # Check if num_records is valid
         if self.num_records <= 0:
             errors.append("Number of records must be greater than 0")
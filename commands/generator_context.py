@@ -6,9 +6,11 @@ This module provides the GeneratorContext class that contains all necessary
 dependencies for command execution in the mock data generation system.
 """
 
-from typing import Dict, Any, List
+from collections import deque
+from typing import Dict, Any, Iterator, List
 from config import Config
 from factories.generator_factory import GeneratorFactory
+from generators.base_generator import BaseGenerator
 from schema_analyzer import SchemaAnalyzer
 from cache.schema_cache import SchemaCache
 
@@ -32,7 +34,14 @@ class GeneratorContext:
         self.factory = GeneratorFactory(config)
         self.cache = SchemaCache()
         self.analyzer = SchemaAnalyzer(cache=self.cache)
-        self.saved_records = []
+        # deque keeps appends O(1) without the amortized reallocation of a list
+        self.saved_records = deque()
+        # Columnar (structure-of-arrays) mirror of the saved records, keyed by
+        # insurance type then top-level field name; field-name strings are
+        # stored once per column instead of once per record
+        self._columns: Dict[str, Dict[str, List[Any]]] = {}
+        self._column_lengths: Dict[str, int] = {}
+        self._generator_cache: Dict[str, BaseGenerator] = {}
     
     def get_factory(self) -> GeneratorFactory:
         """
@@ -43,6 +52,30 @@ class GeneratorContext:
         """
         return self.factory
     
+    def get_or_create_generator(self, insurance_type: str) -> BaseGenerator:
+        """
+        Get a cached generator for an insurance type, creating it on first use.
+
+        Generators are stateless between records, so repeated commands for the
+        same insurance type can share one instance instead of paying the
+        factory setup cost per execution.
+
+        Args:
+            insurance_type: Type of insurance to get a generator for
+
+        Returns:
+            Generator instance for the insurance type
+        """
+        generator = self._generator_cache.get(insurance_type)
+        if generator is None:
+            generator = self.factory.create_generator(insurance_type)
+            self._generator_cache[insurance_type] = generator
+        return generator
+
+    def clear_generator_cache(self) -> None:
+        """Clear all cached generator instances."""
+        self._generator_cache.clear()
+
     def get_analyzer(self) -> SchemaAnalyzer:
         """
         Get the schema analyzer.
@@ -71,20 +104,76 @@ class GeneratorContext:
         """
         for record in records:
             record["insurance_type"] = insurance_type
-            self.saved_records.append(record)
-    
+        # One C-level extend instead of a per-record append
+        self.saved_records.extend(records)
+
+        # Mirror the batch into per-field columns; None pads fields that a
+        # given record does not carry so all columns stay aligned
+        columns = self._columns.setdefault(insurance_type, {})
+        length = self._column_lengths.get(insurance_type, 0)
+        for record in records:
+            for field_name, value in record.items():
+                column = columns.get(field_name)
+                if column is None:
+                    column = columns[field_name] = [None] * length
+                column.append(value)
+            length += 1
+            for column in columns.values():
+                if len(column) < length:
+                    column.append(None)
+        self._column_lengths[insurance_type] = length
+
     def get_saved_records(self) -> List[Dict[str, Any]]:
         """
-        Get all saved records.
-        
+        Get a snapshot of all saved records.
+
         Returns:
             List of saved records
         """
-        return self.saved_records.copy()
+        return list(self.saved_records)
+
+    def iter_saved_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over saved records without copying them.
+
+        Returns:
+            Iterator over the saved records
+        """
+        return iter(self.saved_records)
     
+    def get_columns(self, insurance_type: str) -> Dict[str, List[Any]]:
+        """
+        Get the columnar view of saved records for an insurance type.
+
+        Args:
+            insurance_type: Type of insurance to get columns for
+
+        Returns:
+            Dict mapping field names to aligned value lists
+        """
+        return self._columns.get(insurance_type, {})
+
+    def as_records(self, insurance_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily rebuild row-shaped records from the columnar store.
+
+        Args:
+            insurance_type: Type of insurance to rebuild records for
+
+        Returns:
+            Iterator of record dicts (absent fields appear as None)
+        """
+        columns = self._columns.get(insurance_type)
+        if not columns:
+            return iter(())
+        field_names = list(columns)
+        return (dict(zip(field_names, row)) for row in zip(*columns.values()))
+
     def clear_saved_records(self) -> None:
         """Clear all saved records."""
         self.saved_records.clear()
+        self._columns.clear()
+        self._column_lengths.clear()
     
     def get_saved_record_count(self) -> int:
         """
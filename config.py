@@ -6,11 +6,19 @@ This module provides centralized configuration management for the mock data gene
 extracting hardcoded values from the original MockDataGenerator class.
 """
 
+import sys
 from pathlib import Path
-from typing import Set, Dict, Any, Optional
+from typing import FrozenSet, Set, Dict, Any, Optional
 import yaml
 from exceptions import ConfigurationError
 
+# libyaml's C loader parses config files several times faster than the
+# pure-Python SafeLoader; fall back when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Config:
     """Configuration class for Mock Data Generator."""
@@ -25,8 +33,10 @@ class Config:
         # Ensure output directory exists
         self.output_path.mkdir(parents=True, exist_ok=True)
         
-        # Fields that should preserve original values (not anonymized)
-        self.preserve_fields = {
+        # Fields that should preserve original values (not anonymized).
+        # Interned names make the per-field membership probes cheaper, and the
+        # frozen view below lets readers share the set without copying it.
+        self.preserve_fields = {sys.intern(field) for field in {
             'status', 'message', 'transId', 'entity',  # API response metadata
             'id',  # Entity/API identifiers like "vehicleUnited", "life", "travel"
             'requiredRenewal', 'isExpired', 'isActive', 'isSmart', 'isKlasi', 'isRiziko', 'isCopyPolicyDoc', 'isPaila', 'isIndependent', 'isNew',  # Boolean flags
@@ -36,7 +46,8 @@ class Config:
             'paymentNo',  # Fields that should remain null
             'yieldBeginningYear', 'lastDeposit', 'depositedThisYear', 'availableWithdraw', 'withdrawDate', 'yieldFromYearBeginningTotal',  # Nullable fields
             'fromDeposit', 'fromSaving', 'yieldUpdateDate', 'dailyYieldUpdateDate', 'hasProfitsShare', 'updateTo', 'dailyUpdateTo', 'tsuotPopup'  # More nullable fields
-        }
+        }}
+        self._preserve_fields_view = None
     
     @classmethod
     def from_yaml(cls, config_data: Dict[str, Any]) -> 'Config':
@@ -56,7 +67,8 @@ class Config:
         
         # Update preserve fields if provided
         if 'preserve_fields' in config_data:
-            config.preserve_fields = set(config_data['preserve_fields'])
+            config.preserve_fields = {sys.intern(field) for field in config_data['preserve_fields']}
+            config._preserve_fields_view = None
         
         return config
     
@@ -64,7 +76,7 @@ class Config:
     def from_yaml_file(cls, file_path: str) -> 'Config':
         """Create Config instance from YAML file."""
         with open(file_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
         return cls.from_yaml(config_data)
     
     def validate(self) -> None:
@@ -83,15 +95,20 @@ class Config:
     
     def add_preserve_field(self, field_name: str) -> None:
         """Add a field to the preserve list."""
-        self.preserve_fields.add(field_name)
-    
+        self.preserve_fields.add(sys.intern(field_name))
+        self._preserve_fields_view = None
+
     def remove_preserve_field(self, field_name: str) -> None:
         """Remove a field from the preserve list."""
         self.preserve_fields.discard(field_name)
-    
-    def list_preserve_fields(self) -> Set[str]:
-        """Get all preserve fields."""
-        return self.preserve_fields.copy()
+        self._preserve_fields_view = None
+
+    def list_preserve_fields(self) -> FrozenSet[str]:
+        """Get all preserve fields as a shared immutable view."""
+        view = self._preserve_fields_view
+        if view is None:
+            view = self._preserve_fields_view = frozenset(self.preserve_fields)
+        return view
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for serialization."""
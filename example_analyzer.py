@@ -1,63 +1,164 @@
+import hashlib
 import json
 import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
 from collections import defaultdict, Counter
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, List
 import argparse
 
-# Fields that should never use real example values (PII)
-PII_FIELDS = {"name", "firstName", "lastName", "id", "idNumber", "email", "phone", "address"}
+# Fields that should never use real example values (PII); frozen and interned
+# so the per-field membership probes can hit on pointer equality
+PII_FIELDS = frozenset(sys.intern(field) for field in (
+    "name", "firstName", "lastName", "id", "idNumber", "email", "phone", "address"
+))
+
+# Analysis results are cached on disk under <example_dir>/.cache, keyed by
+# a fingerprint of every example file's name, mtime and size — editing,
+# adding or removing a file changes the key and forces a fresh analysis
+_CACHE_SUBDIR = ".cache"
+
+def _examples_fingerprint(example_dir: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with os.scandir(example_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.name.endswith(".json") and entry.is_file():
+                stat = entry.stat()
+                digest.update(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+def _cached_analysis(kind: str, example_dir: str, compute):
+    """
+    Return compute()'s result, served from the on-disk cache when the
+    example files are unchanged since it was last stored.
+    """
+    try:
+        fingerprint = _examples_fingerprint(example_dir)
+    except OSError:
+        # Missing/unreadable directory: let compute() surface the error
+        # exactly as the uncached path would
+        return compute()
+    cache_dir = os.path.join(example_dir, _CACHE_SUBDIR)
+    cache_path = os.path.join(cache_dir, f"{kind}-{fingerprint}.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+    result = compute()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Stale fingerprints for this kind are superseded; drop them
+        for name in os.listdir(cache_dir):
+            if name.startswith(f"{kind}-") and name.endswith(".pkl"):
+                os.unlink(os.path.join(cache_dir, name))
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best effort; the computed result is still valid
+        pass
+    return result
+
+def _read_example(item):
+    # Whole-file bytes read straight into orjson, skipping the text-mode
+    # wrapper layers; errors travel back to the caller for the warning
+    name, path = item
+    try:
+        return name, orjson.loads(Path(path).read_bytes()), None
+    except Exception as e:
+        return name, None, e
+
+def _iter_examples(example_dir: str):
+    """
+    Yield (filename, parsed_data) for each JSON example file, so every caller
+    shares one directory walk and one parse per file.
+    """
+    # os.scandir yields DirEntry objects with the full path and a cached
+    # is_file() check, saving a stat per entry over os.listdir + os.path.join
+    with os.scandir(example_dir) as entries:
+        items = [(entry.name, entry.path)
+                 for entry in entries
+                 if entry.name.endswith(".json") and entry.is_file()]
+    if len(items) > 1:
+        # Overlap the per-file read latency; decoding happens in the
+        # workers too since orjson releases little but the files are small
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+            results = list(pool.map(_read_example, items))
+    else:
+        results = [_read_example(item) for item in items]
+    for name, data, error in results:
+        if error is not None:
+            print(f"Warning: Could not process {name}: {error}")
+        else:
+            yield name, data
 
 def analyze_examples(example_dir: str = "data/examples/") -> Dict[str, List]:
     """
     Scan example files and build a profile of common values for each field, excluding PII fields.
     Returns a dict: {field_name: [most_common_values]}
+
+    The result is cached on disk and reused until the example files change.
     """
+    return _cached_analysis("profiles", example_dir, lambda: _analyze_examples(example_dir))
+
+def _analyze_examples(example_dir: str) -> Dict[str, List]:
     field_profiles = defaultdict(Counter)
-    for filename in os.listdir(example_dir):
-        if filename.endswith(".json"):
-            with open(os.path.join(example_dir, filename), 'r', encoding='utf-8') as f:
-                try:
-                    data = json.load(f)
-                    flatten_and_count(data, field_profiles)
-                except Exception as e:
-                    print(f"Warning: Could not process {filename}: {e}")
+    for _, data in _iter_examples(example_dir):
+        flatten_and_count(data, field_profiles)
     # Convert counters to lists of most common values
     return {k: [v for v, _ in counter.most_common(10)] for k, counter in field_profiles.items()}
 
 def flatten_and_count(d, profiles, prefix=''):
-    if isinstance(d, dict):
+    # Collect the leaves first, then feed each prefix's values to its Counter
+    # in one C-level update instead of incrementing per scalar
+    leaves = []
+    _collect_leaves(d, leaves, prefix)
+    leaves.sort(key=itemgetter(0))
+    for key, group in groupby(leaves, key=itemgetter(0)):
+        profiles[key].update(value for _, value in group)
+
+def _collect_leaves(d, leaves, prefix='', pii=PII_FIELDS):
+    # type() identity checks: JSON data only contains exact dict/list instances
+    if type(d) is dict:
         for k, v in d.items():
             key = f"{prefix}.{k}" if prefix else k
-            if k in PII_FIELDS:
+            if k in pii:
                 continue  # Skip PII fields
-            flatten_and_count(v, profiles, key)
-    elif isinstance(d, list):
+            _collect_leaves(v, leaves, key)
+    elif type(d) is list:
         for item in d:
-            flatten_and_count(item, profiles, prefix)
+            _collect_leaves(item, leaves, prefix)
     else:
-        if prefix.split('.')[-1] not in PII_FIELDS:
-            profiles[prefix][d] += 1
+        if prefix.split('.')[-1] not in pii:
+            leaves.append((prefix, d))
 
 def summarize_examples(example_dir: str = "data/examples/") -> Dict:
     """
     Output a summary report: insurance types, field structures, value distributions.
+
+    The result is cached on disk and reused until the example files change.
     """
+    return _cached_analysis("summary", example_dir, lambda: _summarize_examples(example_dir))
+
+def _summarize_examples(example_dir: str) -> Dict:
     summary = {
         "insurance_types": set(),
         "fields": set(),
         "value_distributions": defaultdict(Counter)
     }
-    for filename in os.listdir(example_dir):
-        if filename.endswith(".json"):
-            with open(os.path.join(example_dir, filename), 'r', encoding='utf-8') as f:
-                try:
-                    data = json.load(f)
-                    # Try to infer insurance type from filename or top-level keys
-                    insurance_type = filename.split('_')[0] if '_' in filename else filename.replace('.json', '')
-                    summary["insurance_types"].add(insurance_type)
-                    collect_fields_and_values(data, summary["fields"], summary["value_distributions"])
-                except Exception as e:
-                    print(f"Warning: Could not process {filename}: {e}")
+    for filename, data in _iter_examples(example_dir):
+        # Try to infer insurance type from filename or top-level keys
+        insurance_type = filename.split('_')[0] if '_' in filename else filename.replace('.json', '')
+        summary["insurance_types"].add(insurance_type)
+        collect_fields_and_values(data, summary["fields"], summary["value_distributions"])
     # Convert sets to sorted lists for output
     summary["insurance_types"] = sorted(summary["insurance_types"])
     summary["fields"] = sorted(summary["fields"])
@@ -67,19 +168,19 @@ def summarize_examples(example_dir: str = "data/examples/") -> Dict:
     }
     return summary
 
-def collect_fields_and_values(d, fields_set, value_distributions, prefix=''):
-    if isinstance(d, dict):
+def collect_fields_and_values(d, fields_set, value_distributions, prefix='', pii=PII_FIELDS):
+    if type(d) is dict:
         for k, v in d.items():
             key = f"{prefix}.{k}" if prefix else k
-            if k in PII_FIELDS:
+            if k in pii:
                 continue
             fields_set.add(key)
             collect_fields_and_values(v, fields_set, value_distributions, key)
-    elif isinstance(d, list):
+    elif type(d) is list:
         for item in d:
             collect_fields_and_values(item, fields_set, value_distributions, prefix)
     else:
-        if prefix.split('.')[-1] not in PII_FIELDS:
+        if prefix.split('.')[-1] not in pii:
             value_distributions[prefix][d] += 1
 
 if __name__ == "__main__":
@@ -17,15 +17,26 @@ class MockDataGenerationError(Exception):
     def __init__(self, message: str, details: dict = None):
         """
         Initialize the exception.
-        
+
         Args:
             message: Human-readable error message
             details: Optional dictionary with additional error details
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
-    
+        self._details = details
+
+    @property
+    def details(self) -> dict:
+        """Details dict, built lazily so caught-and-discarded raises stay cheap."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+
+    def _build_details(self) -> dict:
+        """Build the details dict on first access. Subclasses override."""
+        return {}
+
     def __str__(self) -> str:
         """Return string representation of the exception."""
         if self.details:
@@ -49,10 +60,12 @@ class SchemaAnalysisError(MockDataGenerationError):
             message: Human-readable error message
             schema_data: Optional schema data that caused the error
         """
-        details = {"schema_data": schema_data} if schema_data else {}
-        super().__init__(message, details)
+        super().__init__(message)
         self.schema_data = schema_data
 
+    def _build_details(self) -> dict:
+        return {"schema_data": self.schema_data} if self.schema_data else {}
+
 
 class InsuranceTypeNotFoundError(MockDataGenerationError):
     """
@@ -70,19 +83,27 @@ class InsuranceTypeNotFoundError(MockDataGenerationError):
             insurance_type: The insurance type that was not found
             available_types: Optional list of available insurance types
         """
-        message = f"Insurance type '{insurance_type}' not found or not supported"
-        if available_types:
-            message += f". Available types: {', '.join(available_types)}"
-        
-        details = {
-            "requested_type": insurance_type,
-            "available_types": available_types or []
-        }
-        
-        super().__init__(message, details)
+        # Keep __init__ cheap: the available-types join is deferred to
+        # __str__, so hot miss paths that catch the error never pay for it
+        super().__init__(f"Insurance type '{insurance_type}' not found or not supported")
         self.insurance_type = insurance_type
         self.available_types = available_types or []
 
+    def __str__(self) -> str:
+        """Render the full message, joining available types on demand."""
+        message = self.message
+        if self.available_types:
+            message += f". Available types: {', '.join(self.available_types)}"
+        if self.details:
+            message += f" - Details: {self.details}"
+        return message
+
+    def _build_details(self) -> dict:
+        return {
+            "requested_type": self.insurance_type,
+            "available_types": self.available_types
+        }
+
 
 class ConfigurationError(MockDataGenerationError):
     """
@@ -100,10 +121,12 @@ class ConfigurationError(MockDataGenerationError):
             message: Human-readable error message
             config_path: Optional path to the configuration file
         """
-        details = {"config_path": config_path} if config_path else {}
-        super().__init__(message, details)
+        super().__init__(message)
         self.config_path = config_path
 
+    def _build_details(self) -> dict:
+        return {"config_path": self.config_path} if self.config_path else {}
+
 
 class ValidationError(MockDataGenerationError):
     """
@@ -122,14 +145,16 @@ class ValidationError(MockDataGenerationError):
             validation_errors: Optional list of specific validation errors
             data: Optional data that failed validation
         """
-        details = {
-            "validation_errors": validation_errors or [],
-            "data": data
-        }
-        super().__init__(message, details)
+        super().__init__(message)
         self.validation_errors = validation_errors or []
         self.data = data
 
+    def _build_details(self) -> dict:
+        return {
+            "validation_errors": self.validation_errors,
+            "data": self.data
+        }
+
 
 class GeneratorError(MockDataGenerationError):
     """
@@ -148,10 +173,12 @@ class GeneratorError(MockDataGenerationError):
             generator_type: Optional type of generator that failed
             operation: Optional operation that failed
         """
-        details = {
-            "generator_type": generator_type,
-            "operation": operation
-        }
-        super().__init__(message, details)
+        super().__init__(message)
         self.generator_type = generator_type
-        self.operation = operation 
\ No newline at end of file
+        self.operation = operation
+
+    def _build_details(self) -> dict:
+        return {
+            "generator_type": self.generator_type,
+            "operation": self.operation
+        } 
\ No newline at end of file
@@ -7,15 +7,9 @@ for different insurance types using the factory pattern.
 """
 
 from typing import Type
-from faker import Faker
 from config import Config
 from generators.base_generator import BaseGenerator
 from generators.registry import GeneratorRegistry
-from generators.insurance_generator import InsuranceGenerator
-from generators.travel_insurance_generator import TravelInsuranceGenerator
-from generators.vehicle_united_generator import VehicleUnitedGenerator
-from generators.mymoney_generator import MyMoneyGenerator
-from generators.excellence_saving_generator import ExcellenceSavingGenerator
 from exceptions import InsuranceTypeNotFoundError, GeneratorError
 
 
@@ -38,14 +32,26 @@ class GeneratorFactory:
         self.config = config
         self.field_profiles = field_profiles or {}
         self.registry = GeneratorRegistry()
+        # Faker startup loads provider modules and locale data, so a single
+        # shared instance is built lazily on first use and handed to
+        # generators as a factory callable; generators that never touch
+        # self.faker never pay for it
+        self._faker = None
+        # Available-types snapshot, rebuilt only when the registry changes
+        self._available_types_cache = None
         self._register_generators()
     
     def _register_generators(self) -> None:
-        """Register all available generators in the registry."""
-        self.registry.register("MyMoneyResponse", MyMoneyGenerator)
-        self.registry.register("ActiveInsurancesWithVehicleUnitedResponse", VehicleUnitedGenerator)
-        self.registry.register("ExcellenceSavingByNumResponse", ExcellenceSavingGenerator)
-        self.registry.register("travel", TravelInsuranceGenerator)
+        """Register all available generators in the registry.
+
+        Generators are registered by import path so their modules are only
+        imported when a type is first requested, keeping factory start-up
+        independent of the number of registered types.
+        """
+        self.registry.register("MyMoneyResponse", "generators.mymoney_generator:MyMoneyGenerator")
+        self.registry.register("ActiveInsurancesWithVehicleUnitedResponse", "generators.vehicle_united_generator:VehicleUnitedGenerator")
+        self.registry.register("ExcellenceSavingByNumResponse", "generators.excellence_saving_generator:ExcellenceSavingGenerator")
+        self.registry.register("travel", "generators.travel_insurance_generator:TravelInsuranceGenerator")
         
         # TODO: Register specific insurance type generators as they are created
         # self.registry.register("travel", TravelGenerator)
@@ -73,11 +79,17 @@ class GeneratorFactory:
             available_types = self.get_available_types()
             raise InsuranceTypeNotFoundError(insurance_type, available_types)
         
-        # Create Faker instance with Hebrew locale
-        faker = Faker(['he_IL'])
-        
-        # Create and return the generator instance
-        return generator_class(faker, self.config, self.field_profiles)
+        # Create and return the generator instance with the shared Faker
+        # factory; the instance is only materialized if the generator uses it
+        return generator_class(self._get_faker, self.config, self.field_profiles)
+
+    def _get_faker(self):
+        """Build the shared Faker on first use and reuse it afterwards."""
+        faker = self._faker
+        if faker is None:
+            from faker import Faker
+            faker = self._faker = Faker(['he_IL'])
+        return faker
     
     def get_available_types(self) -> list:
         """
@@ -86,7 +98,10 @@ class GeneratorFactory:
         Returns:
             List of available insurance type identifiers
         """
-        return self.registry.get_available_types()
+        types = self._available_types_cache
+        if types is None:
+            types = self._available_types_cache = self.registry.get_available_types()
+        return types
     
     def is_supported(self, insurance_type: str) -> bool:
         """
@@ -109,6 +124,7 @@ class GeneratorFactory:
             generator_class: Class that inherits from BaseGenerator
         """
         self.registry.register(insurance_type, generator_class)
+        self._available_types_cache = None
     
     def unregister_generator(self, insurance_type: str) -> bool:
         """
@@ -120,6 +136,7 @@ class GeneratorFactory:
         Returns:
             True if unregistered, False if not found
         """
+        self._available_types_cache = None
         return self.registry.unregister(insurance_type)
     
     def get_generator_info(self, insurance_type: str) -> dict:
@@ -8,6 +8,8 @@ defining the common interface and dependency injection pattern.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
+
+import orjson
 from faker import Faker
 from config import Config
 
@@ -19,27 +21,73 @@ class BaseGenerator(ABC):
     This class defines the common interface that all generators must implement,
     providing dependency injection for Faker and Config instances.
     """
-    
+
+    # Slots keep instances dict-free for the fixed dependency attributes;
+    # subclasses without their own __slots__ still get a __dict__ as usual
+    __slots__ = ('_faker', 'config', '_preserve_fields_cache', '_required_fields')
+
     def __init__(self, faker: Faker, config: Config):
         """
         Initialize the generator with dependencies.
-        
+
         Args:
-            faker: Faker instance for generating realistic data
+            faker: Faker instance for generating realistic data, or a
+                zero-argument callable that builds one. Passing a callable
+                defers Faker's expensive locale-provider load until a
+                generator actually touches self.faker — generators that
+                never do (e.g. example-profile-driven ones) skip it
+                entirely
             config: Configuration instance with paths and settings
         """
-        self.faker = faker
+        self._faker = faker
         self.config = config
-    
+        # Snapshot taken once so get_preserve_fields does not re-copy the
+        # config set on every call
+        self._preserve_fields_cache = set(config.preserve_fields)
+        # Required-fields tuple is derived from get_schema() on first
+        # validate_record call; None marks it as not yet built
+        self._required_fields = None
+
+    @property
+    def faker(self) -> Faker:
+        """Faker instance, built on first access when a factory was given."""
+        faker = self._faker
+        if callable(faker):
+            faker = self._faker = faker()
+        return faker
+
+    @faker.setter
+    def faker(self, value) -> None:
+        self._faker = value
+
     @abstractmethod
     def generate_record(self) -> Dict[str, Any]:
         """
         Generate a single mock record for the insurance type.
-        
+
+        Implementations must return only JSON-native types
+        (dict/list/str/int/float/bool/None) so records can be serialized
+        directly with orjson via to_json.
+
         Returns:
             Dict containing the generated mock data record
         """
         pass
+
+    def to_json(self, record: Dict[str, Any]) -> bytes:
+        """
+        Serialize a generated record to JSON bytes.
+
+        Uses orjson, which is several times faster than the stdlib json
+        module on the dict/list-heavy records the generators produce.
+
+        Args:
+            record: A record produced by generate_record
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return orjson.dumps(record)
     
     @abstractmethod
     def get_schema(self) -> Dict[str, Any]:
@@ -54,14 +102,57 @@ class BaseGenerator(ABC):
     def generate_multiple_records(self, count: int) -> List[Dict[str, Any]]:
         """
         Generate multiple mock records.
-        
+
         Args:
             count: Number of records to generate
-            
+
         Returns:
             List of generated mock data records
         """
-        return [self.generate_record() for _ in range(count)]
+        return self.generate_records_batch(count)
+
+    def generate_records_batch(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Generate a batch of mock records as one pre-sized operation.
+
+        Subclasses with expensive per-record setup can override this to
+        amortize that work across the whole batch (e.g. pre-drawing value
+        pools once); the default simply builds the batch with a bound
+        generate_record so no per-record attribute lookup is paid.
+
+        Args:
+            count: Number of records to generate
+
+        Returns:
+            List of generated mock data records
+        """
+        generate = self.generate_record
+        return [generate() for _ in range(count)]
+
+    def generate_records_parallel(self, count: int, max_workers: int = None,
+                                  seed: int = None) -> List[Dict[str, Any]]:
+        """
+        Generate a batch of records across multiple worker processes.
+
+        Record generation is CPU-bound and records are independent, so
+        large batches can be split across cores. Each worker builds its
+        own Faker and generator once; only the record dicts are pickled
+        back, making this worthwhile for large counts.
+
+        Args:
+            count: Number of records to generate
+            max_workers: Optional worker count (defaults to the CPU count)
+            seed: Optional base seed mixed into each worker's RNG
+
+        Returns:
+            List of generated mock data records
+        """
+        from .parallel import generate_records_parallel
+        return generate_records_parallel(
+            type(self), self.config, count,
+            field_profiles=getattr(self, 'field_profiles', None),
+            max_workers=max_workers, seed=seed
+        )
     
     def validate_record(self, record: Dict[str, Any]) -> List[str]:
         """
@@ -73,17 +164,13 @@ class BaseGenerator(ABC):
         Returns:
             List of validation error messages (empty if valid)
         """
-        # Default implementation - can be overridden by subclasses
-        errors = []
-        schema = self.get_schema()
-        
-        # Basic validation - check required fields
-        if 'required_fields' in schema:
-            for field in schema['required_fields']:
-                if field not in record:
-                    errors.append(f"Missing required field: {field}")
-        
-        return errors
+        # Default implementation - can be overridden by subclasses.
+        # The required-fields tuple is extracted from the schema once and
+        # cached, so repeated validations skip the get_schema() call
+        required = self._required_fields
+        if required is None:
+            required = self._required_fields = tuple(self.get_schema().get('required_fields', ()))
+        return [f"Missing required field: {field}" for field in required if field not in record]
     
     def get_insurance_type(self) -> str:
         """
@@ -98,8 +185,10 @@ class BaseGenerator(ABC):
     def get_preserve_fields(self) -> set:
         """
         Get the fields that should preserve original values.
-        
+
         Returns:
-            Set of field names that should not be anonymized
+            Set of field names that should not be anonymized. The same
+            cached set is returned on every call — treat it as read-only
+            and copy it explicitly before mutating.
         """
-        return self.config.preserve_fields.copy() 
\ No newline at end of file
+        return self._preserve_fields_cache 
\ No newline at end of file
@@ -2,192 +2,367 @@ from generators.base_generator import BaseGenerator
 from faker import Faker
 from config import Config
 import random
+from copy import deepcopy
 from datetime import datetime, timedelta
 
+# Static literal tables hoisted to module level so record generation only
+# references them instead of rebuilding dicts/lists per call
+_TITLE_SUBTITLE_MAP = {
+    "יתרה לתחילת שנה": "יתרת כספים בקופה בתחילת השנה",
+    "הפקדות": "כספים שהופקדו לקופה",
+    "רווחים": "בניכוי הוצאות לניהול השקעות",
+    "דמי ניהול": "שנגבו בשנה זאת",
+    "הפסדים": "בניכוי הוצאות לניהול השקעות"
+}
+_ACCOUNT_TITLES = ("יתרה לתחילת שנה", "הפקדות", "רווחים", "דמי ניהול", "הפסדים")
+_YEARS = ("2025", "2024", "2023", "2022")
+_POLICY_NAMES = ("קופת גמל", "פוליסת ביטוח")
+_COST_TITLES = ("הפניקס גמל לבני 60 ומעלה", "הפניקס גמל לבני 50 ומטה")
+_PAYMENT_TITLES = ("סכום למשיכה חד פעמית", "סכום למקרה מוות")
+_ROUTE_TITLES = ("הפניקס גמל לבני 60 ומעלה",)
+
+# Management-fee section skeleton; only the two updateDate leaves vary per
+# record, so the rest is deep-copied from this template instead of being
+# spelled out literal-by-literal on every call
+_MGMT_FEE_TEMPLATE = {
+    "percentageMngFee": {
+        "updateDate": None,
+        "fromDeposit": {"percentageData": {"value": 0, "sign": "%"}},
+        "fromSaving": {"percentageData": {"value": 1.05, "sign": "%"}}
+    },
+    "updatedMngFee": {
+        "updateDate": None,
+        "fromDeposit": {
+            "percentageData": {"value": 0, "sign": "%"},
+            "popupData": {"list": [{"fromDeposit": {"value": 0, "sign": "%"}, "dateFrom": "", "dateTo": ""}]}
+        },
+        "fromSaving": {
+            "percentageData": {"value": 1.05, "sign": "%"},
+            "popupData": {"list": [{"fromSaving": {"value": 1.05, "sign": "%"}, "dateFrom": "", "dateTo": ""}]}
+        }
+    }
+}
+
+# All 180 candidate dates pre-formatted once, so record generation only
+# indexes into this table instead of allocating datetimes and calling strftime
+_TODAY = datetime(2025, 7, 7)
+_DATES = tuple(
+    {"date": d.strftime("%d.%m.%Y"), "short": d.strftime("%d.%m.%y")}
+    for d in (_TODAY - timedelta(days=days_ago) for days_ago in range(1, 181))
+)
+
 class ExcellenceSavingGenerator(BaseGenerator):
+    __slots__ = ('field_profiles', 'example_prob', '_rng',
+                 '_sentence_pool', '_company_pool', '_name_pool')
+
     def __init__(self, faker: Faker, config: Config, field_profiles=None, example_prob=0.7):
         super().__init__(faker, config)
         self.field_profiles = field_profiles or {}
         self.example_prob = example_prob
+        # Private RNG skips the module-level random's shared global state
+        self._rng = random.Random()
+        # Faker calls (word lookup, locale formatting) dominate record cost,
+        # so draw small value pools once up front and index into them per
+        # record instead of calling Faker each time. Read through the
+        # property so a lazily-constructed Faker is materialized first.
+        faker = self.faker
+        self._sentence_pool = tuple(faker.sentence() for _ in range(256))
+        self._company_pool = tuple(faker.company() for _ in range(256))
+        self._name_pool = tuple(faker.name() for _ in range(1024))
+
+    def generate_record(self) -> dict:
+        return self._build_record()
 
-    def generate_record(self):
-        dates = self._generate_dates()
-        record = {
+    def _build_record(self) -> dict:
+        # Fused builder: the whole record is constructed in one frame with
+        # the RNG, Faker, picker and date strings bound to locals once,
+        # instead of dispatching to nine section methods that each re-read
+        # them off self. The _generate_* methods below are kept as the
+        # per-section reference implementations for callers that want a
+        # single section.
+        rng = self._rng
+        randint = rng.randint
+        randrange = rng.randrange
+        names = self._name_pool
+        sentences = self._sentence_pool
+        pick_from = self._pick_from
+        dates = _DATES[randrange(len(_DATES))]
+        date = dates["date"]
+        short = dates["short"]
+
+        general_flags = rng.getrandbits(3)
+        # Both policy-number components come from one 40-bit draw; slight
+        # modulo bias is fine for mock data
+        policy_bits = rng.getrandbits(40)
+
+        possible_titles = (
+            *_ACCOUNT_TITLES[:4],
+            "יתרה לתאריך {}".format(date),
+            _ACCOUNT_TITLES[4]
+        )
+        per_year = len(possible_titles)
+        account_flags = rng.getrandbits(1 + len(_YEARS) * per_year)
+
+        cost_flags = rng.getrandbits(3)
+
+        return {
             "message": "",
             "response": {
-                "general": self._generate_general(dates),
-                "noticeUpdate": self._generate_notice_update(dates),
-                "accountTransactions": self._generate_account_transactions(dates),
-                "deposits": self._generate_deposits(dates),
+                "general": {
+                    "policyName": pick_from("response.general.policyName", _POLICY_NAMES),
+                    "policyNickname": None,
+                    "policyNumber": "001-001-%d (%d)" % (
+                        100000 + (policy_bits & 0xFFFFF) % 900000,
+                        1000000 + (policy_bits >> 20) % 9000000
+                    ),
+                    "updatedAt": date,
+                    "startDate": None,
+                    "kiumRechivSachir": bool(general_flags & 1),
+                    "name": names[randrange(len(names))],
+                    "isNew": bool(general_flags & 2),
+                    "isSeif14": bool(general_flags & 4),
+                    "dataSource": None
+                },
+                "noticeUpdate": {
+                    "generalDetails": {
+                        "startDate": date,
+                        "oldAccountNumber": f"{randint(100,999)}-00000000",
+                        "employerName": pick_from("response.noticeUpdate.generalDetails.employerName", self._company_pool),
+                        "withdrawDate": None,
+                        "establishmentDate": None
+                    },
+                    "treatmentSubjects": []
+                },
+                "accountTransactions": {
+                    "updateDate": date,
+                    "totalSum": {"value": randint(1000, 20000), "currency": "₪"},
+                    "dailySum": {"value": randint(1000, 20000), "currency": "₪"},
+                    "oneTimeWithdrawDate": date,
+                    "oneTimeWithdrawDateIsOver": bool(account_flags & 1),
+                    "list": [
+                        {
+                            "year": year,
+                            "updateDate": date,
+                            "list": [
+                                self._generate_account_transaction_item(
+                                    title, dates,
+                                    account_flags >> (1 + year_idx * per_year + title_idx) & 1
+                                )
+                                for title_idx, title in enumerate(possible_titles)
+                            ]
+                        } for year_idx, year in enumerate(_YEARS)
+                    ]
+                },
+                "deposits": {
+                    "dailyDeposits": {"list": []},
+                    "yearlyDeposits": {
+                        "list": [
+                            {"year": year, "updateDate": date, "list": []} for year in _YEARS
+                        ]
+                    }
+                },
                 "managementFee": self._generate_management_fee(dates),
-                "yearCostPrediction": self._generate_year_cost_prediction(dates),
-                "investmentRoutesTransferConcentration": self._generate_investment_routes_transfer_concentration(dates),
-                "expectedPayments": self._generate_expected_payments(dates),
-                "beneficiaries": self._generate_beneficiaries(dates)
+                "yearCostPrediction": {
+                    "updateDate": short,
+                    "list": [
+                        {
+                            "title": pick_from("response.yearCostPrediction.list.title", _COST_TITLES),
+                            "savingFee": {"value": 1.05, "sign": "%"} if cost_flags & 1 else None,
+                            "depositFee": {"value": 0, "sign": "%"} if cost_flags & 2 else None,
+                            "expenseCommission": {"value": 0.28, "sign": "%"},
+                            "expenseNonCommission": {"value": 0.09, "sign": "%"},
+                            "yearCostPrediction": {"value": 1.42, "sign": "%"} if cost_flags & 4 else None
+                        }
+                    ]
+                },
+                "investmentRoutesTransferConcentration": {
+                    "investmentRoutes": {
+                        "updateDate": date,
+                        "list": [
+                            {
+                                "yieldPercentage": {"value": 2.72, "sign": "%"},
+                                "investmentRouteTitle": pick_from("response.investmentRoutesTransferConcentration.investmentRoutes.list.investmentRouteTitle", _ROUTE_TITLES),
+                                "investmentSum": {"value": 11294.32, "currency": "₪"},
+                                "updateDate": date,
+                                "tsuotLastUpdateDate": "2025-04-30T21:00:00.000+00:00",
+                                "periodicRoute": None,
+                                "isExistRoute": True,
+                                "investmentPercent": {"value": 100, "sign": "%"},
+                                "dailyYieldUpdateDate": date
+                            }
+                        ],
+                        "transferConcentration": {"list": [], "updatedAt": ""}
+                    }
+                },
+                "expectedPayments": {
+                    "updateDate": date,
+                    # Unrolled for the fixed count of 2: no iterator or
+                    # loop machinery for a known-size list
+                    "list": [
+                        {
+                            "title": pick_from("response.expectedPayments.list.title", _PAYMENT_TITLES),
+                            "subTitle": sentences[randrange(len(sentences))],
+                            "sum": {"value": randint(1000, 20000), "currency": "₪"}
+                        },
+                        {
+                            "title": pick_from("response.expectedPayments.list.title", _PAYMENT_TITLES),
+                            "subTitle": sentences[randrange(len(sentences))],
+                            "sum": {"value": randint(1000, 20000), "currency": "₪"}
+                        }
+                    ]
+                },
+                "beneficiaries": {
+                    "list": [
+                        {
+                            "name": names[randrange(len(names))],
+                            "date": date
+                        }
+                    ],
+                    "updatedAt": ""
+                }
             },
             "status": 200
         }
-        return record
 
-    def get_schema(self):
+    def get_schema(self) -> dict:
         return {"type": "object", "properties": {}}
 
     def _pick_example_or_faker(self, field_key, faker_func, *args, **kwargs):
-        values = self.field_profiles.get(field_key, [])
-        if values and random.random() < self.example_prob:
-            return random.choice(values)
+        values = self.field_profiles.get(field_key)
+        if values:
+            rng = self._rng
+            if rng.random() < self.example_prob:
+                return values[rng.randrange(len(values))]
         return faker_func(*args, **kwargs)
 
-    def _generate_dates(self):
-        today = datetime(2025, 7, 7)
-        days_ago = random.randint(1, 180)
-        date = today - timedelta(days=days_ago)
-        return {
-            "date": date.strftime("%d.%m.%Y"),
-            "short": date.strftime("%d.%m.%y")
-        }
+    def _pick_from(self, field_key, defaults):
+        # Tuple-backed variant of _pick_example_or_faker: picking straight
+        # from a precomputed defaults tuple avoids building a lambda closure
+        # and an inner list per field per record
+        rng = self._rng
+        values = self.field_profiles.get(field_key)
+        pool = values if values and rng.random() < self.example_prob else defaults
+        return pool[rng.randrange(len(pool))]
+
+    def _generate_dates(self) -> dict:
+        return _DATES[self._rng.randrange(len(_DATES))]
 
-    def _generate_general(self, dates):
+    def _generate_general(self, dates) -> dict:
+        # One getrandbits draw covers all three boolean flags
+        flags = self._rng.getrandbits(3)
+        policy_bits = self._rng.getrandbits(40)
         return {
-            "policyName": self._pick_example_or_faker("response.general.policyName", lambda: random.choice(["קופת גמל", "פוליסת ביטוח" ])),
+            "policyName": self._pick_from("response.general.policyName", _POLICY_NAMES),
             "policyNickname": None,
-            "policyNumber": f"001-001-{random.randint(100000,999999)} ({random.randint(1000000,9999999)})",
+            "policyNumber": "001-001-%d (%d)" % (
+                100000 + (policy_bits & 0xFFFFF) % 900000,
+                1000000 + (policy_bits >> 20) % 9000000
+            ),
             "updatedAt": dates["date"],
             "startDate": None,
-            "kiumRechivSachir": random.choice([True, False]),
-            "name": self.faker.name(),
-            "isNew": random.choice([True, False]),
-            "isSeif14": random.choice([True, False]),
+            "kiumRechivSachir": bool(flags & 1),
+            "name": self._name_pool[self._rng.randrange(len(self._name_pool))],
+            "isNew": bool(flags & 2),
+            "isSeif14": bool(flags & 4),
             "dataSource": None
         }
 
-    def _generate_notice_update(self, dates):
+    def _generate_notice_update(self, dates) -> dict:
         return {
             "generalDetails": {
                 "startDate": dates["date"],
-                "oldAccountNumber": f"{random.randint(100,999)}-00000000",
-                "employerName": self._pick_example_or_faker("response.noticeUpdate.generalDetails.employerName", self.faker.company),
+                "oldAccountNumber": f"{self._rng.randint(100,999)}-00000000",
+                "employerName": self._pick_from("response.noticeUpdate.generalDetails.employerName", self._company_pool),
                 "withdrawDate": None,
                 "establishmentDate": None
             },
             "treatmentSubjects": []
         }
 
-    def _generate_account_transactions(self, dates):
-        years = ["2025", "2024", "2023", "2022"]
-        # Mapping from title to subTitle
-        title_subtitle_map = {
-            "יתרה לתחילת שנה": "יתרת כספים בקופה בתחילת השנה",
-            "הפקדות": "כספים שהופקדו לקופה",
-            "רווחים": "בניכוי הוצאות לניהול השקעות",
-            "דמי ניהול": "שנגבו בשנה זאת",
-            "הפסדים": "בניכוי הוצאות לניהול השקעות"
-        }
-        def get_subtitle(title):
-            if title.startswith("יתרה לתאריך"):
-                return None
-            return title_subtitle_map.get(title)
-        possible_titles = [
-            "יתרה לתחילת שנה",
-            "הפקדות",
-            "רווחים",
-            "דמי ניהול",
+    def _generate_account_transactions(self, dates) -> dict:
+        # Only the dated balance title varies per record; splice it into the
+        # static title tuple
+        possible_titles = (
+            *_ACCOUNT_TITLES[:4],
             "יתרה לתאריך {}".format(dates["date"]),
-            "הפסדים"
-        ]
+            _ACCOUNT_TITLES[4]
+        )
+        # One bit per transaction item coin plus one for the withdraw flag,
+        # drawn in a single getrandbits call
+        per_year = len(possible_titles)
+        flags = self._rng.getrandbits(1 + len(_YEARS) * per_year)
         return {
             "updateDate": dates["date"],
-            "totalSum": {"value": random.randint(1000, 20000), "currency": "₪"},
-            "dailySum": {"value": random.randint(1000, 20000), "currency": "₪"},
+            "totalSum": {"value": self._rng.randint(1000, 20000), "currency": "₪"},
+            "dailySum": {"value": self._rng.randint(1000, 20000), "currency": "₪"},
             "oneTimeWithdrawDate": dates["date"],
-            "oneTimeWithdrawDateIsOver": random.choice([True, False]),
+            "oneTimeWithdrawDateIsOver": bool(flags & 1),
             "list": [
                 {
                     "year": year,
                     "updateDate": dates["date"],
                     "list": [
-                        self._generate_account_transaction_item(title, dates)
-                        for title in possible_titles
+                        self._generate_account_transaction_item(
+                            title, dates, flags >> (1 + year_idx * per_year + title_idx) & 1
+                        )
+                        for title_idx, title in enumerate(possible_titles)
                     ]
-                } for year in years
+                } for year_idx, year in enumerate(_YEARS)
             ]
         }
 
-    def _generate_account_transaction_item(self, title, dates):
+    def _generate_account_transaction_item(self, title, dates, has_sum) -> dict:
         item = {
             "title": title,
-            "sum": {"value": random.randint(-200, 20000), "currency": "₪"} if random.choice([True, False]) else None
+            "sum": {"value": self._rng.randint(-200, 20000), "currency": "₪"} if has_sum else None
         }
         # Set subTitle only if mapping exists and not יתרה לתאריך ...
-        if title.startswith("יתרה לתאריך"):
-            pass  # Do not include subTitle
-        else:
-            title_subtitle_map = {
-                "יתרה לתחילת שנה": "יתרת כספים בקופה בתחילת השנה",
-                "הפקדות": "כספים שהופקדו לקופה",
-                "רווחים": "בניכוי הוצאות לניהול השקעות",
-                "דמי ניהול": "שנגבו בשנה זאת",
-                "הפסדים": "בניכוי הוצאות לניהול השקעות"
-            }
-            sub_title = title_subtitle_map.get(title)
+        if not title.startswith("יתרה לתאריך"):
+            sub_title = _TITLE_SUBTITLE_MAP.get(title)
             if sub_title:
                 item["subTitle"] = sub_title
         return item
 
-    def _generate_deposits(self, dates):
-        years = ["2025", "2024", "2023", "2022"]
+    def _generate_deposits(self, dates) -> dict:
         return {
             "dailyDeposits": {"list": []},
             "yearlyDeposits": {
                 "list": [
-                    {"year": year, "updateDate": dates["date"], "list": []} for year in years
+                    {"year": year, "updateDate": dates["date"], "list": []} for year in _YEARS
                 ]
             }
         }
 
-    def _generate_management_fee(self, dates):
-        return {
-            "percentageMngFee": {
-                "updateDate": dates["short"],
-                "fromDeposit": {"percentageData": {"value": 0, "sign": "%"}},
-                "fromSaving": {"percentageData": {"value": 1.05, "sign": "%"}}
-            },
-            "updatedMngFee": {
-                "updateDate": dates["date"],
-                "fromDeposit": {
-                    "percentageData": {"value": 0, "sign": "%"},
-                    "popupData": {"list": [{"fromDeposit": {"value": 0, "sign": "%"}, "dateFrom": "", "dateTo": ""}]}
-                },
-                "fromSaving": {
-                    "percentageData": {"value": 1.05, "sign": "%"},
-                    "popupData": {"list": [{"fromSaving": {"value": 1.05, "sign": "%"}, "dateFrom": "", "dateTo": ""}]}
-                }
-            }
-        }
+    def _generate_management_fee(self, dates) -> dict:
+        fee = deepcopy(_MGMT_FEE_TEMPLATE)
+        fee["percentageMngFee"]["updateDate"] = dates["short"]
+        fee["updatedMngFee"]["updateDate"] = dates["date"]
+        return fee
 
-    def _generate_year_cost_prediction(self, dates):
+    def _generate_year_cost_prediction(self, dates) -> dict:
+        flags = self._rng.getrandbits(3)
         return {
             "updateDate": dates["short"],
             "list": [
                 {
-                    "title": self._pick_example_or_faker("response.yearCostPrediction.list.title", lambda: random.choice(["הפניקס גמל לבני 60 ומעלה", "הפניקס גמל לבני 50 ומטה"])),
-                    "savingFee": {"value": 1.05, "sign": "%"} if random.choice([True, False]) else None,
-                    "depositFee": {"value": 0, "sign": "%"} if random.choice([True, False]) else None,
+                    "title": self._pick_from("response.yearCostPrediction.list.title", _COST_TITLES),
+                    "savingFee": {"value": 1.05, "sign": "%"} if flags & 1 else None,
+                    "depositFee": {"value": 0, "sign": "%"} if flags & 2 else None,
                     "expenseCommission": {"value": 0.28, "sign": "%"},
                     "expenseNonCommission": {"value": 0.09, "sign": "%"},
-                    "yearCostPrediction": {"value": 1.42, "sign": "%"} if random.choice([True, False]) else None
+                    "yearCostPrediction": {"value": 1.42, "sign": "%"} if flags & 4 else None
                 }
             ]
         }
 
-    def _generate_investment_routes_transfer_concentration(self, dates):
+    def _generate_investment_routes_transfer_concentration(self, dates) -> dict:
         return {
             "investmentRoutes": {
                 "updateDate": dates["date"],
                 "list": [
                     {
                         "yieldPercentage": {"value": 2.72, "sign": "%"},
-                        "investmentRouteTitle": self._pick_example_or_faker("response.investmentRoutesTransferConcentration.investmentRoutes.list.investmentRouteTitle", lambda: "הפניקס גמל לבני 60 ומעלה"),
+                        "investmentRouteTitle": self._pick_from("response.investmentRoutesTransferConcentration.investmentRoutes.list.investmentRouteTitle", _ROUTE_TITLES),
                         "investmentSum": {"value": 11294.32, "currency": "₪"},
                         "updateDate": dates["date"],
                         "tsuotLastUpdateDate": "2025-04-30T21:00:00.000+00:00",
@@ -201,23 +376,28 @@ class ExcellenceSavingGenerator(BaseGenerator):
             }
         }
 
-    def _generate_expected_payments(self, dates):
+    def _generate_expected_payments(self, dates) -> dict:
         return {
             "updateDate": dates["date"],
             "list": [
                 {
-                    "title": self._pick_example_or_faker("response.expectedPayments.list.title", lambda: random.choice(["סכום למשיכה חד פעמית", "סכום למקרה מוות"])),
-                    "subTitle": self.faker.sentence(),
-                    "sum": {"value": random.randint(1000, 20000), "currency": "₪"}
-                } for _ in range(2)
+                    "title": self._pick_from("response.expectedPayments.list.title", _PAYMENT_TITLES),
+                    "subTitle": self._sentence_pool[self._rng.randrange(len(self._sentence_pool))],
+                    "sum": {"value": self._rng.randint(1000, 20000), "currency": "₪"}
+                },
+                {
+                    "title": self._pick_from("response.expectedPayments.list.title", _PAYMENT_TITLES),
+                    "subTitle": self._sentence_pool[self._rng.randrange(len(self._sentence_pool))],
+                    "sum": {"value": self._rng.randint(1000, 20000), "currency": "₪"}
+                }
             ]
         }
 
-    def _generate_beneficiaries(self, dates):
+    def _generate_beneficiaries(self, dates) -> dict:
         return {
             "list": [
                 {
-                    "name": self.faker.name(),
+                    "name": self._name_pool[self._rng.randrange(len(self._name_pool))],
                     "date": dates["date"]
                 }
             ],
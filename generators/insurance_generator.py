@@ -14,6 +14,28 @@ from config import Config
 from .base_generator import BaseGenerator
 from exceptions import GeneratorError, ValidationError
 
+# Default item schema for arrays without one, shared instead of
+# reallocated on every _generate_mock_array call
+_DEFAULT_ITEMS_SCHEMA = {"type": "string"}
+
+# Policy date windows (start 1-180 days back, end 364 days later)
+# pre-formatted at import so generate_realistic_dates is a table index
+# instead of four strftime calls
+_BASE_DATE = datetime(2025, 7, 7)
+_POLICY_DATE_TABLE = tuple(
+    {
+        "start_date": start.strftime("%d.%m.%Y"),
+        "end_date": end.strftime("%d.%m.%Y"),
+        "start_date_short": start.strftime("%d.%m.%y"),
+        "end_date_short": end.strftime("%d.%m.%y")
+    }
+    for start, end in (
+        (_BASE_DATE - timedelta(days=days_ago),
+         _BASE_DATE - timedelta(days=days_ago) + timedelta(days=364))
+        for days_ago in range(1, 181)
+    )
+)
+
 
 class InsuranceGenerator(BaseGenerator):
     """
@@ -22,46 +44,150 @@ class InsuranceGenerator(BaseGenerator):
     This class implements the BaseGenerator interface and provides
     methods for generating realistic insurance records.
     """
-    
+
+    # Schema is immutable, so it is built once at class definition and
+    # shared by all instances; the property items are snapshotted as a
+    # tuple so field loops skip the per-call dict traversal
+    _SCHEMA = {
+        "type": "object",
+        "properties": {
+            "insurance_type": {"type": "string"},
+            "policy_id": {"type": "string"},
+            "start_date": {"type": "string"},
+            "end_date": {"type": "string"},
+            "status": {"type": "string"}
+        },
+        "required_fields": ["insurance_type", "policy_id", "start_date", "end_date", "status"]
+    }
+    _SCHEMA_PROPERTY_ITEMS = tuple(_SCHEMA["properties"].items())
+
     def __init__(self, faker: Faker, config: Config, field_profiles=None):
         """Initialize the insurance generator."""
         super().__init__(faker, config)
         self.field_profiles = field_profiles or {}
-    
+        self._record_builder = None
+        # Field-name dispatch resolved once per field and memoized, so the
+        # substring ladder runs at most once per distinct field name
+        self._string_fn_cache = {}
+        self._number_fn_cache = {}
+        # Pool of Faker-generated date strings, filled on first use so the
+        # lazy Faker stays unbuilt until a date field is actually generated
+        self._date_pool = None
+        # Schema-type dispatch table: one dict lookup replaces the if/elif
+        # chain on every recursive _generate_mock_value call
+        self._value_dispatch = {
+            "string": lambda schema, field_name: self._generate_mock_string(field_name),
+            "number": lambda schema, field_name: self._generate_mock_number(field_name),
+            "boolean": lambda schema, field_name: random.choice((True, False)),
+            "array": self._generate_mock_array,
+            "object": self._generate_mock_object,
+        }
+
     def generate_record(self) -> Dict[str, Any]:
         """
         Generate a single insurance record.
-        
+
+        The schema is compiled once into a specialized builder function, so
+        per-record generation is a single call with no schema traversal or
+        type dispatch.
+
         Returns:
             Dict containing the generated insurance record
         """
-        # This is a placeholder - will be implemented with specific insurance type logic
-        return {
-            "insurance_type": "general",
-            "policy_id": f"POL-{random.randint(100000, 999999)}",
-            "start_date": self.faker.date(),
-            "end_date": self.faker.date(),
-            "status": "active"
+        builder = self._record_builder
+        if builder is None:
+            builder = self._record_builder = self._compile_record_builder(self.get_schema())
+        return builder()
+
+    def _compile_record_builder(self, schema: Dict[str, Any]):
+        """
+        Compile the schema into a specialized record-builder function.
+
+        Walks the schema once and emits Python source that hardcodes the
+        field order and the generation expression for each field, then
+        compiles it. The resulting callable builds a record as one dict
+        display instead of re-interpreting the schema per record.
+
+        Args:
+            schema: Schema definition to compile
+
+        Returns:
+            Zero-argument callable producing a new record dict
+        """
+        lines = ["def _generate_record():", "    return {"]
+        for field_name, field_def in schema.get("properties", {}).items():
+            lines.append(f"        {field_name!r}: {self._compile_field_expr(field_name, field_def)},")
+        lines.append("    }")
+
+        namespace = {
+            "faker": self.faker,
+            "_date": self._random_date,
+            "randint": random.randint,
+            "uniform": random.uniform,
+            "choice": random.choice,
+            "_mock_value": self._generate_mock_value,
         }
+        exec(compile("\n".join(lines), "<record-builder>", "exec"), namespace)
+        return namespace["_generate_record"]
+
+    def _compile_field_expr(self, field_name: str, field_def: Dict[str, Any]) -> str:
+        """
+        Build the source expression for a single field of the compiled builder.
+
+        Mirrors the dispatch rules of _generate_mock_string/_generate_mock_number,
+        resolved once at compile time instead of per record.
+
+        Args:
+            field_name: Name of the field to generate
+            field_def: Schema definition for the field
+
+        Returns:
+            Python expression string generating the field value
+        """
+        field_type = field_def.get("type", "string")
+        field_lower = field_name.lower()
+
+        if field_type == "string":
+            if field_name == "insurance_type":
+                return "'general'"
+            elif field_name == "status":
+                return "'active'"
+            elif "date" in field_lower:
+                return "_date()"
+            elif any(word in field_lower for word in ['name', 'שם']):
+                return "faker.name()"
+            elif any(word in field_lower for word in ['email', 'אימייל']):
+                return "faker.email()"
+            elif any(word in field_lower for word in ['phone', 'טלפון']):
+                return "faker.phone_number()"
+            elif any(word in field_lower for word in ['policy', 'פוליסה']):
+                return "f'POL-{randint(100000, 999999)}'"
+            elif any(word in field_lower for word in ['currency', 'מטבע']):
+                return "choice(('₪', '$', '€', '£'))"
+            else:
+                return f"f'Mock_{field_name}_{{randint(1000, 9999)}}'"
+        elif field_type == "number":
+            if any(word in field_lower for word in ['amount', 'sum', 'value', 'סכום', 'ערך']):
+                return "round(uniform(1000, 1000000), 2)"
+            elif any(word in field_lower for word in ['percent', 'percentage', 'אחוז']):
+                return "round(uniform(0, 100), 2)"
+            else:
+                return "randint(1, 1000)"
+        elif field_type == "boolean":
+            return "choice((True, False))"
+        else:
+            # Objects/arrays fall back to the runtime schema interpreter
+            return f"_mock_value({field_def!r}, {field_name!r})"
     
     def get_schema(self) -> Dict[str, Any]:
         """
         Get the schema definition for insurance records.
-        
+
         Returns:
-            Dict containing the schema structure
-        """
-        return {
-            "type": "object",
-            "properties": {
-                "insurance_type": {"type": "string"},
-                "policy_id": {"type": "string"},
-                "start_date": {"type": "string"},
-                "end_date": {"type": "string"},
-                "status": {"type": "string"}
-            },
-            "required_fields": ["insurance_type", "policy_id", "start_date", "end_date", "status"]
-        }
+            Dict containing the schema structure; the same shared instance
+            is returned on every call, so treat it as read-only
+        """
+        return self._SCHEMA
     
     def _generate_base_fields(self, schema: Dict[str, Any], dates: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -75,21 +201,25 @@ class InsuranceGenerator(BaseGenerator):
             Dict containing basic fields
         """
         base_record = {}
-        
-        for field_name, field_def in schema.get("properties", {}).items():
-            if field_def.get("type") == "string":
+
+        items = self._SCHEMA_PROPERTY_ITEMS if schema is self._SCHEMA \
+            else schema.get("properties", {}).items()
+        for field_name, field_def in items:
+            # Resolve the type once per field instead of per branch
+            ftype = field_def.get("type")
+            if ftype == "string":
                 if "date" in field_name.lower():
                     if "end" in field_name.lower():
-                        base_record[field_name] = dates.get("end_date", self.faker.date())
+                        base_record[field_name] = dates.get("end_date") or self._random_date()
                     else:
-                        base_record[field_name] = dates.get("start_date", self.faker.date())
+                        base_record[field_name] = dates.get("start_date") or self._random_date()
                 else:
                     base_record[field_name] = self._generate_mock_string(field_name)
-            elif field_def.get("type") == "number":
+            elif ftype == "number":
                 base_record[field_name] = self._generate_mock_number(field_name)
-            elif field_def.get("type") == "boolean":
+            elif ftype == "boolean":
                 base_record[field_name] = random.choice([True, False])
-        
+
         return base_record
     
     def _generate_complex_fields(self, schema: Dict[str, Any], dates: Dict[str, str]) -> Dict[str, Any]:
@@ -104,13 +234,16 @@ class InsuranceGenerator(BaseGenerator):
             Dict containing complex fields
         """
         complex_fields = {}
-        
-        for field_name, field_def in schema.get("properties", {}).items():
-            if field_def.get("type") == "object":
+
+        items = self._SCHEMA_PROPERTY_ITEMS if schema is self._SCHEMA \
+            else schema.get("properties", {}).items()
+        for field_name, field_def in items:
+            ftype = field_def.get("type")
+            if ftype == "object":
                 complex_fields[field_name] = self._generate_mock_object(field_def, field_name)
-            elif field_def.get("type") == "array":
+            elif ftype == "array":
                 complex_fields[field_name] = self._generate_mock_array(field_def, field_name)
-        
+
         return complex_fields
     
     def _merge_records(self, base_record: Dict[str, Any], complex_fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -124,39 +257,61 @@ class InsuranceGenerator(BaseGenerator):
         Returns:
             Dict containing the complete merged record
         """
-        merged_record = base_record.copy()
-        merged_record.update(complex_fields)
-        return merged_record
+        # Single-pass dict unpacking instead of copy() + update()
+        return {**base_record, **complex_fields}
     
     def _generate_mock_string(self, field_name: str) -> str:
         """Generate appropriate mock string based on field name."""
+        fn = self._string_fn_cache.get(field_name)
+        if fn is None:
+            fn = self._string_fn_cache[field_name] = self._resolve_string_fn(field_name)
+        return fn()
+
+    def _resolve_string_fn(self, field_name: str):
+        """
+        Resolve the string-generation callable for a field name.
+
+        Runs the substring-matching ladder once; _generate_mock_string
+        memoizes the result so subsequent records pay only a dict lookup.
+        """
         field_lower = field_name.lower()
-        
+
         if any(word in field_lower for word in ['name', 'שם']):
-            return self.faker.name()
+            return self.faker.name
         elif any(word in field_lower for word in ['email', 'אימייל']):
-            return self.faker.email()
+            return self.faker.email
         elif any(word in field_lower for word in ['phone', 'טלפון']):
-            return self.faker.phone_number()
+            return self.faker.phone_number
         elif any(word in field_lower for word in ['policy', 'פוליסה']):
-            return f"POL-{random.randint(100000, 999999)}"
+            return lambda: f"POL-{random.randint(100000, 999999)}"
         elif any(word in field_lower for word in ['currency', 'מטבע']):
-            return random.choice(['₪', '$', '€', '£'])
+            return lambda: random.choice(['₪', '$', '€', '£'])
         elif any(word in field_lower for word in ['status', 'סטטוס']):
-            return random.choice(['active', 'inactive', 'pending', 'expired'])
+            return lambda: random.choice(['active', 'inactive', 'pending', 'expired'])
         else:
-            return f"Mock_{field_name}_{random.randint(1000, 9999)}"
-    
+            return lambda: f"Mock_{field_name}_{random.randint(1000, 9999)}"
+
     def _generate_mock_number(self, field_name: str) -> float:
         """Generate appropriate mock number based on field name."""
+        fn = self._number_fn_cache.get(field_name)
+        if fn is None:
+            fn = self._number_fn_cache[field_name] = self._resolve_number_fn(field_name)
+        return fn()
+
+    def _resolve_number_fn(self, field_name: str):
+        """
+        Resolve the number-generation callable for a field name.
+
+        Same memoized-ladder pattern as _resolve_string_fn.
+        """
         field_lower = field_name.lower()
-        
+
         if any(word in field_lower for word in ['amount', 'sum', 'value', 'סכום', 'ערך']):
-            return round(random.uniform(1000, 1000000), 2)
+            return lambda: round(random.uniform(1000, 1000000), 2)
         elif any(word in field_lower for word in ['percent', 'percentage', 'אחוז']):
-            return round(random.uniform(0, 100), 2)
+            return lambda: round(random.uniform(0, 100), 2)
         else:
-            return random.randint(1, 1000)
+            return lambda: random.randint(1, 1000)
     
     def _generate_mock_object(self, schema: Dict[str, Any], field_name: str) -> Dict[str, Any]:
         """Generate mock object based on schema."""
@@ -170,39 +325,35 @@ class InsuranceGenerator(BaseGenerator):
     
     def _generate_mock_array(self, schema: Dict[str, Any], field_name: str) -> List[Any]:
         """Generate mock array based on schema."""
-        items_schema = schema.get("items", {"type": "string"})
-        array_length = random.randint(1, 5)
-        
-        return [self._generate_mock_value(items_schema, field_name) for _ in range(array_length)]
+        items_schema = schema.get("items") or _DEFAULT_ITEMS_SCHEMA
+        generate = self._generate_mock_value
+        return [generate(items_schema, field_name) for _ in range(random.randint(1, 5))]
     
     def _generate_mock_value(self, schema: Dict[str, Any], field_name: str = "") -> Any:
         """Generate a mock value based on schema definition."""
-        schema_type = schema.get("type", "string")
-        
-        if schema_type == "string":
-            return self._generate_mock_string(field_name)
-        elif schema_type == "number":
-            return self._generate_mock_number(field_name)
-        elif schema_type == "boolean":
-            return random.choice([True, False])
-        elif schema_type == "array":
-            return self._generate_mock_array(schema, field_name)
-        elif schema_type == "object":
-            return self._generate_mock_object(schema, field_name)
-        else:
-            return self._generate_mock_string(field_name)
+        dispatch = self._value_dispatch
+        fn = dispatch.get(schema.get("type", "string")) or dispatch["string"]
+        return fn(schema, field_name)
     
+    def _random_date(self) -> str:
+        """
+        Draw a date string from a pooled set of Faker dates.
+
+        Faker's date() parses and formats a fresh random date per call;
+        the pool amortizes 1024 of those draws over all records, at the
+        cost of occasional repeats in large batches.
+        """
+        pool = self._date_pool
+        if pool is None:
+            faker_date = self.faker.date
+            pool = self._date_pool = tuple(faker_date() for _ in range(1024))
+        return pool[random.randrange(len(pool))]
+
     def generate_realistic_dates(self) -> Dict[str, str]:
-        """Generate realistic policy dates based on today's date."""
-        today = datetime(2025, 7, 7)
-        
-        days_ago = random.randint(1, 180)
-        start_date = today - timedelta(days=days_ago)
-        end_date = start_date + timedelta(days=364)
-        
-        return {
-            "start_date": start_date.strftime("%d.%m.%Y"),
-            "end_date": end_date.strftime("%d.%m.%Y"),
-            "start_date_short": start_date.strftime("%d.%m.%y"),
-            "end_date_short": end_date.strftime("%d.%m.%y")
-        } 
\ No newline at end of file
+        """
+        Generate realistic policy dates based on today's date.
+
+        Dates come from a table precomputed at import; the returned dict
+        is shared, so treat it as read-only.
+        """
+        return _POLICY_DATE_TABLE[random.randrange(len(_POLICY_DATE_TABLE))] 
\ No newline at end of file
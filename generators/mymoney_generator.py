@@ -2,12 +2,43 @@ from generators.base_generator import BaseGenerator
 from faker import Faker
 from config import Config
 import random
+import sys
 from datetime import datetime, timedelta
 
+# All 180 candidate dates pre-formatted at import, so _generate_dates is a
+# table index instead of datetime construction plus two strftime calls
+_TODAY = datetime(2025, 7, 7)
+_DATE_TABLE = tuple(
+    {"date": d.strftime("%d.%m.%Y"), "short": d.strftime("%d.%m.%y")}
+    for d in (_TODAY - timedelta(days=days_ago) for days_ago in range(1, 181))
+)
+
+# The currency and sign markers are non-ASCII/short literals that CPython
+# does not intern on its own; interning them keeps one shared object per
+# marker across the hundreds of dicts built per record
+_SHEKEL = sys.intern("₪")
+_PCT = sys.intern("%")
+
+
+def _money(value):
+    """Wrap a numeric value in the shared money-dict shape."""
+    return {"value": value, "currency": _SHEKEL}
+
+
+# Tri-state draws share one tuple instead of building a list per call
+_TRI_STATE = (True, False, None)
+
+# Policy-id prefixes and format template resolved once at import instead of
+# an if/elif ladder plus a fresh f-string per call
+_POLICY_ID_PREFIX = {"gemel": "001", "hishtalmut": "007", "gemelInvestment": "570"}
+_POLICY_ID_FMT = "{p}-{a:03d}-{b:06d} ({c:07d})".format
+
 class MyMoneyGenerator(BaseGenerator):
     def __init__(self, faker: Faker, config: Config, field_profiles=None, example_prob=0.7):
         super().__init__(faker, config)
-        self.field_profiles = field_profiles or {}
+        # Tuples index faster than lists and the dict holds no empty
+        # defaults, so the per-field picker stays allocation-free
+        self.field_profiles = {key: tuple(values) for key, values in (field_profiles or {}).items()}
         self.example_prob = example_prob
 
     def generate_record(self):
@@ -19,9 +50,9 @@ class MyMoneyGenerator(BaseGenerator):
             "entity": "MyMoneyResponse",
             "response": None,
             "topHeader": self._generate_top_header(),
-            "mainHeader": self._generate_main_header(),
-            "accumulationByProduct": self._generate_accumulation_by_product(),
-            "productList": self._generate_product_list(),
+            "mainHeader": self._generate_main_header(dates),
+            "accumulationByProduct": self._generate_accumulation_by_product(dates),
+            "productList": self._generate_product_list(dates),
             "lastActions": self._generate_last_actions()
         }
         return record
@@ -30,101 +61,83 @@ class MyMoneyGenerator(BaseGenerator):
         return {"type": "object", "properties": {}}
 
     def _pick_example_or_faker(self, field_key, faker_func, *args, **kwargs):
-        values = self.field_profiles.get(field_key, [])
+        values = self.field_profiles.get(field_key)
         if values and random.random() < self.example_prob:
-            return random.choice(values)
+            return values[random.randrange(len(values))]
         return faker_func(*args, **kwargs)
 
     def _generate_dates(self):
-        today = datetime(2025, 7, 7)
-        days_ago = random.randint(1, 180)
-        start_date = today - timedelta(days=days_ago)
-        return {
-            "date": start_date.strftime("%d.%m.%Y"),
-            "short": start_date.strftime("%d.%m.%y")
-        }
+        return _DATE_TABLE[random.randrange(len(_DATE_TABLE))]
 
     def _generate_top_header(self):
-        total_savings = random.randint(100000, 2000000)
-        month_change = random.uniform(-5, 5)
-        accumulate_change = random.uniform(-50000, 50000)
+        # Local bindings skip the module-attribute lookup per draw
+        randint = random.randint
+        uniform = random.uniform
+        total_savings = randint(100000, 2000000)
+        month_change = uniform(-5, 5)
+        accumulate_change = uniform(-50000, 50000)
         return {
-            "sumSaving": {
-                "value": total_savings,
-                "currency": "₪"
-            },
-            "numSavingChannel": random.randint(1, 3),
+            "sumSaving": _money(total_savings),
+            "numSavingChannel": randint(1, 3),
             "monthChange": {
                 "value": round(month_change, 2),
-                "sign": "%"
+                "sign": _PCT
             },
-            "sumMonthChange": {
-                "value": round(total_savings * month_change / 100, 2),
-                "currency": "₪"
-            },
-            "accumulateChange": {
-                "value": round(accumulate_change, 2),
-                "currency": "₪"
-            }
+            "sumMonthChange": _money(round(total_savings * month_change / 100, 2)),
+            "accumulateChange": _money(round(accumulate_change, 2))
         }
 
-    def _generate_main_header(self):
-        dates = self._generate_dates()
+    def _generate_main_header(self, dates=None):
+        # Dates are drawn once per record and threaded through; drawing
+        # fresh ones is kept only for direct callers
+        if dates is None:
+            dates = self._generate_dates()
         total_savings = random.randint(100000, 2000000)
-        fluent_withdraw = random.randint(0, total_savings // 2) if random.choice([True, False]) else None
-        expected_retirement = random.randint(5000, 50000) if random.choice([True, False]) else None
+        # One getrandbits draw covers both optional-section coins
+        flags = random.getrandbits(2)
+        fluent_withdraw = random.randint(0, total_savings // 2) if flags & 1 else None
+        expected_retirement = random.randint(5000, 50000) if flags & 2 else None
         return {
             "date": dates["date"],
-            "totalSaving": {
-                "value": total_savings,
-                "currency": "₪"
-            },
-            "fluentWithdraw": {
-                "value": fluent_withdraw,
-                "currency": "₪"
-            } if fluent_withdraw else None,
-            "expectedForRetirement": {
-                "value": expected_retirement,
-                "currency": "₪"
-            } if expected_retirement else None,
+            "totalSaving": _money(total_savings),
+            "fluentWithdraw": _money(fluent_withdraw) if fluent_withdraw else None,
+            "expectedForRetirement": _money(expected_retirement) if expected_retirement else None,
             "savingExpectedForRetirement": None
         }
 
-    def _generate_accumulation_by_product(self):
+    def _generate_accumulation_by_product(self, dates=None):
+        if dates is None:
+            dates = self._generate_dates()
         product_types = ["gemel", "hishtalmut", "gemelInvestment"]
         accumulation_list = []
-        for product_type in product_types:
-            if random.choice([True, False]):
-                saving_sum = random.randint(50000, 500000)
-                fluent_sum = random.randint(0, saving_sum) if product_type in ["hishtalmut", "gemelInvestment"] else None
-                expected_retirement = random.randint(5000, 30000) if product_type == "gemel" else None
+        randint = random.randint
+        flags = random.getrandbits(len(product_types))
+        for product_idx, product_type in enumerate(product_types):
+            if flags >> product_idx & 1:
+                saving_sum = randint(50000, 500000)
+                fluent_sum = randint(0, saving_sum) if product_type in ["hishtalmut", "gemelInvestment"] else None
+                expected_retirement = randint(5000, 30000) if product_type == "gemel" else None
                 accumulation_list.append({
                     "policyType": self._pick_example_or_faker("response.accumulationByProduct.list.policyType", lambda: product_type),
-                    "savingSum": {
-                        "value": saving_sum,
-                        "currency": "₪"
-                    },
-                    "fluentSum": {
-                        "value": fluent_sum,
-                        "currency": "₪"
-                    } if fluent_sum else None,
+                    "savingSum": _money(saving_sum),
+                    "fluentSum": _money(fluent_sum) if fluent_sum else None,
                     "eligibilityDate": "",
-                    "expectedForRetirement": {
-                        "value": expected_retirement,
-                        "currency": "₪"
-                    } if expected_retirement else None,
+                    "expectedForRetirement": _money(expected_retirement) if expected_retirement else None,
                     "notUsedForRetirement": product_type in ["hishtalmut", "gemelInvestment"],
                     "policyIds": [self._generate_policy_id(product_type)],
-                    "updateDate": self._generate_dates()["short"]
+                    "updateDate": dates["short"]
                 })
         return {"list": accumulation_list}
 
-    def _generate_product_list(self):
+    def _generate_product_list(self, dates=None):
+        if dates is None:
+            dates = self._generate_dates()
         product_types = ["gemel", "hishtalmut", "gemelInvestment"]
         product_list = []
-        for product_type in product_types:
-            if random.choice([True, False]):
-                policy_list = [self._generate_policy(product_type)]
+        flags = random.getrandbits(len(product_types))
+        for product_idx, product_type in enumerate(product_types):
+            if flags >> product_idx & 1:
+                policy_list = [self._generate_policy(product_type, dates)]
                 product_list.append({
                     "policyType": self._pick_example_or_faker("response.productList.list.policyType", lambda: product_type),
                     "policyList": policy_list
@@ -135,21 +148,27 @@ class MyMoneyGenerator(BaseGenerator):
         return {"list": []}
 
     def _generate_policy_id(self, product_type):
-        if product_type == "gemel":
-            return f"001-{random.randint(100, 999)}-{random.randint(100000, 999999)} ({random.randint(1000000, 9999999)})"
-        elif product_type == "hishtalmut":
-            return f"007-{random.randint(100, 999)}-{random.randint(100000, 999999)} ({random.randint(1000000, 9999999)})"
-        elif product_type == "gemelInvestment":
-            return f"570-{random.randint(100, 999)}-{random.randint(100000, 999999)} ({random.randint(1000000, 9999999)})"
-        else:
+        prefix = _POLICY_ID_PREFIX.get(product_type)
+        if prefix is None:
             return f"{random.randint(100000000, 999999999)}"
+        # All three components come from one 54-bit draw; the slight
+        # modulo bias is fine for mock ids
+        bits = random.getrandbits(54)
+        return _POLICY_ID_FMT(
+            p=prefix,
+            a=100 + (bits & 0x3FF) % 900,
+            b=100000 + (bits >> 10 & 0xFFFFF) % 900000,
+            c=1000000 + (bits >> 30) % 9000000
+        )
 
-    def _generate_policy(self, product_type):
+    def _generate_policy(self, product_type, dates=None):
         policy_id = self._generate_policy_id(product_type)
-        dates = self._generate_dates()
+        if dates is None:
+            dates = self._generate_dates()
         saving_sum = random.randint(50000, 500000)
         status = random.choice([1, 2])
-        investment_route = self._generate_investment_route(product_type, saving_sum)
+        flags = random.getrandbits(4)
+        investment_route = self._generate_investment_route(product_type, saving_sum, dates)
         return {
             "policyId": policy_id,
             "originalPolicyName": None,
@@ -160,15 +179,15 @@ class MyMoneyGenerator(BaseGenerator):
                 "statusDesc": self._pick_example_or_faker("response.productList.list.policyList.status.statusDesc", lambda: ("לא פעילה" if status == 1 else "פעילה"))
             },
             "updateTo": dates["date"],
-            "dailyUpdateTo": dates["date"] if random.choice([True, False]) else None,
-            "yieldUpdateDate": dates["short"] if random.choice([True, False]) else None,
-            "dailyYieldUpdateDate": dates["date"] if random.choice([True, False]) else "",
-            "hasProfitsShare": random.choice([True, False, None]),
-            "productData": self._generate_product_data(product_type, saving_sum),
+            "dailyUpdateTo": dates["date"] if flags & 1 else None,
+            "yieldUpdateDate": dates["short"] if flags & 2 else None,
+            "dailyYieldUpdateDate": dates["date"] if flags & 4 else "",
+            "hasProfitsShare": _TRI_STATE[random.randrange(3)],
+            "productData": self._generate_product_data(product_type, saving_sum, dates),
             "investmentRoutes": [investment_route] if investment_route else [],
             "tsuotPopup": None,
-            "isNew": random.choice([True, False]),
-            "isIndependent": random.choice([True, False, None])
+            "isNew": bool(flags & 8),
+            "isIndependent": _TRI_STATE[random.randrange(3)]
         }
 
     def _generate_subtype(self, product_type):
@@ -177,47 +196,45 @@ class MyMoneyGenerator(BaseGenerator):
         else:
             return None
 
-    def _generate_product_data(self, product_type, saving_sum):
-        dates = self._generate_dates()
-        last_deposit = random.randint(1000, 10000) if random.choice([True, False]) else None
-        available_withdraw = random.randint(0, saving_sum) if random.choice([True, False]) else None
+    def _generate_product_data(self, product_type, saving_sum, dates=None):
+        if dates is None:
+            dates = self._generate_dates()
+        randint = random.randint
+        uniform = random.uniform
+        flags = random.getrandbits(3)
+        last_deposit = randint(1000, 10000) if flags & 1 else None
+        available_withdraw = randint(0, saving_sum) if flags & 2 else None
         return {
-            "savingSum": {
-                "value": saving_sum,
-                "currency": "₪"
-            },
+            "savingSum": _money(saving_sum),
             "yieldBeginningYear": None,
             "lastDeposit": {
-                "lastDepositsSum": {
-                    "value": last_deposit,
-                    "currency": "₪"
-                },
+                "lastDepositsSum": _money(last_deposit),
                 "lastDepositsDate": dates["date"]
             } if last_deposit else None,
             "depositedThisYear": None,
-            "availableWithdraw": {
-                "value": available_withdraw,
-                "currency": "₪"
-            } if available_withdraw else None,
-            "withdrawDate": dates["date"] if random.choice([True, False]) else None,
+            "availableWithdraw": _money(available_withdraw) if available_withdraw else None,
+            "withdrawDate": dates["date"] if flags & 4 else None,
             "managementFee": {
                 "fromDeposit": {
-                    "value": 0 if product_type in ["hishtalmut", "gemelInvestment"] else random.uniform(0, 2),
-                    "sign": "%"
+                    "value": 0 if product_type in ["hishtalmut", "gemelInvestment"] else uniform(0, 2),
+                    "sign": _PCT
                 },
                 "fromSaving": {
-                    "value": random.uniform(0.5, 0.7) if product_type in ["hishtalmut", "gemelInvestment"] else random.uniform(0.1, 0.6),
-                    "sign": "%"
+                    "value": uniform(0.5, 0.7) if product_type in ["hishtalmut", "gemelInvestment"] else uniform(0.1, 0.6),
+                    "sign": _PCT
                 }
             },
             "yieldFromYearBeginningTotal": None
         }
 
-    def _generate_investment_route(self, product_type, saving_sum):
-        if not random.choice([True, False]):
+    def _generate_investment_route(self, product_type, saving_sum, dates=None):
+        flags = random.getrandbits(2)
+        if not flags & 1:
             return None
-        dates = self._generate_dates()
-        yield_value = random.uniform(-3, 4)
+        if dates is None:
+            dates = self._generate_dates()
+        uniform = random.uniform
+        yield_value = uniform(-3, 4)
         route_names = {
             "gemel": "הפניקס גמל אשראי ואג\"ח",
             "hishtalmut": "הפניקס השתלמות אשראי ואג\"ח",
@@ -228,26 +245,23 @@ class MyMoneyGenerator(BaseGenerator):
             "joinDate": None,
             "percent": {
                 "value": 100,
-                "sign": "%"
+                "sign": _PCT
             },
             "yieldBeginningYear": {
                 "value": round(yield_value, 2),
-                "sign": "%"
+                "sign": _PCT
             },
             "yieldBeginningPolicy": None,
             "managementFeeFromDeposit": {
-                "value": 0 if product_type in ["hishtalmut", "gemelInvestment"] else random.uniform(0, 2),
-                "sign": "%"
+                "value": 0 if product_type in ["hishtalmut", "gemelInvestment"] else uniform(0, 2),
+                "sign": _PCT
             },
             "managementFeeFromSaving": {
-                "value": random.uniform(0.5, 0.7) if product_type in ["hishtalmut", "gemelInvestment"] else random.uniform(0.1, 0.6),
-                "sign": "%"
-            },
-            "accumulation": {
-                "value": saving_sum,
-                "currency": "₪"
+                "value": uniform(0.5, 0.7) if product_type in ["hishtalmut", "gemelInvestment"] else uniform(0.1, 0.6),
+                "sign": _PCT
             },
+            "accumulation": _money(saving_sum),
             "basketCode": str(random.randint(10, 9999)),
-            "isYieldHidden": random.choice([True, False, None]),
-            "dailyUpdateDate": dates["date"] if random.choice([True, False]) else None
+            "isYieldHidden": _TRI_STATE[random.randrange(3)],
+            "dailyUpdateDate": dates["date"] if flags & 2 else None
         } 
\ No newline at end of file
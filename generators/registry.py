@@ -6,7 +6,9 @@ This module provides a registry pattern for managing different insurance type ge
 allowing dynamic registration and retrieval of generators.
 """
 
-from typing import Dict, Type, Optional
+import types
+from importlib import import_module
+from typing import Dict, Type, Optional, Union
 from .base_generator import BaseGenerator
 from exceptions import GeneratorError
 
@@ -19,38 +21,76 @@ class GeneratorRegistry:
     for different insurance types using a dictionary-based registry pattern.
     """
     
+    __slots__ = ("_generators", "_frozen")
+
     def __init__(self):
         """Initialize an empty registry."""
-        self._generators: Dict[str, Type[BaseGenerator]] = {}
-    
-    def register(self, insurance_type: str, generator_class: Type[BaseGenerator]) -> None:
+        self._generators: Dict[str, Union[Type[BaseGenerator], str]] = {}
+        self._frozen = False
+
+    def register(self, insurance_type: str, generator_class: Union[Type[BaseGenerator], str]) -> None:
         """
         Register a generator class for a specific insurance type.
-        
+
         Args:
             insurance_type: String identifier for the insurance type
-            generator_class: Class that inherits from BaseGenerator
+            generator_class: Class that inherits from BaseGenerator, or an
+                import path string "module.path:ClassName" that is resolved
+                lazily on first get_generator call
         """
-        if not issubclass(generator_class, BaseGenerator):
+        if self._frozen:
+            raise GeneratorError(
+                "Cannot register on a frozen registry",
+                generator_type=str(generator_class),
+                operation="register"
+            )
+        if not isinstance(generator_class, str) and not issubclass(generator_class, BaseGenerator):
             raise GeneratorError(
                 f"Generator class must inherit from BaseGenerator: {generator_class}",
                 generator_type=str(generator_class),
                 operation="register"
             )
-        
+
         self._generators[insurance_type] = generator_class
-    
+
     def get_generator(self, insurance_type: str) -> Optional[Type[BaseGenerator]]:
         """
         Get the generator class for a specific insurance type.
-        
+
         Args:
             insurance_type: String identifier for the insurance type
-            
+
         Returns:
             Generator class if found, None otherwise
         """
-        return self._generators.get(insurance_type)
+        generator_class = self._generators.get(insurance_type)
+        if isinstance(generator_class, str):
+            # Resolve the "module:Class" path on first use and cache the
+            # class, so unused generator modules are never imported
+            module_path, _, class_name = generator_class.partition(":")
+            generator_class = getattr(import_module(module_path), class_name)
+            if not issubclass(generator_class, BaseGenerator):
+                raise GeneratorError(
+                    f"Generator class must inherit from BaseGenerator: {generator_class}",
+                    generator_type=str(generator_class),
+                    operation="get_generator"
+                )
+            # A frozen mapping cannot cache the resolved class in place;
+            # the import system's module cache still makes re-resolution cheap
+            if not self._frozen:
+                self._generators[insurance_type] = generator_class
+        return generator_class
+
+    def freeze(self) -> None:
+        """
+        Make the registry immutable.
+
+        Swaps the backing dict for a read-only mapping proxy so worker
+        processes and threads can read it without mutation concerns.
+        Registration after freezing raises GeneratorError.
+        """
+        self._generators = types.MappingProxyType(dict(self._generators))
+        self._frozen = True
     
     def get_available_types(self) -> list:
         """
@@ -83,13 +123,24 @@ class GeneratorRegistry:
         Returns:
             True if unregistered, False if not found
         """
+        if self._frozen:
+            raise GeneratorError(
+                "Cannot unregister on a frozen registry",
+                generator_type=insurance_type,
+                operation="unregister"
+            )
         if insurance_type in self._generators:
             del self._generators[insurance_type]
             return True
         return False
-    
+
     def clear(self) -> None:
         """Clear all registered generators."""
+        if self._frozen:
+            raise GeneratorError(
+                "Cannot clear a frozen registry",
+                operation="clear"
+            )
         self._generators.clear()
     
     def count(self) -> int:
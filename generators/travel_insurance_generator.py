@@ -4,16 +4,40 @@ from config import Config
 import random
 from datetime import datetime, timedelta
 
+# Formatted components for every day the trip window can touch (start
+# offsets 1..180 plus durations up to 21), precomputed at import so
+# _generate_travel_dates only indexes instead of calling strftime
+_TODAY = datetime(2025, 7, 7)
+_DAY_TABLE = tuple(
+    (d.strftime("%d.%m.%Y"), d.strftime("%d.%m.%y"), d.strftime("%d/%m/%Y"),
+     d.year, d.month, d.day)
+    for d in (_TODAY + timedelta(days=offset) for offset in range(0, 202))
+)
+
+_PHONE_MODELS = (
+    "אייפון 15 פרו", "אייפון 14 פרו", "סמסונג גלקסי S24", "סמסונג גלקסי S23", "גוגל פיקסל 8", "OnePlus 11"
+)
+_DEVICE_MODELS = (
+    "MEC BOOK AIR", "MEC BOOK PRO", "iPad Pro", "iPad Air", "Surface Pro", "Dell XPS 13", "Lenovo ThinkPad"
+)
+
 class TravelInsuranceGenerator(BaseGenerator):
     def __init__(self, faker: Faker, config: Config, field_profiles=None, example_prob=0.7):
         super().__init__(faker, config)
-        self.field_profiles = field_profiles or {}
+        # Tuples index faster than lists and the dict holds no empty
+        # defaults, so the per-field picker stays allocation-free
+        self.field_profiles = {key: tuple(values) for key, values in (field_profiles or {}).items()}
         self.example_prob = example_prob  # Probability to use example value
+        # Model pickers built once instead of a fresh lambda (and list) per
+        # record in the coverage methods
+        self._rand_phone = lambda: random.choice(_PHONE_MODELS)
+        self._rand_device = lambda: random.choice(_DEVICE_MODELS)
 
     def generate_record(self):
         dates = self._generate_travel_dates()
         insured_count = random.randint(2, 4)
-        insured_persons = [self.faker.first_name() for _ in range(insured_count)]
+        first_name = self.faker.first_name
+        insured_persons = [first_name() for _ in range(insured_count)]
         coverage_response = {
             "basicCoverage": self._generate_coverage_with_insured(insured_persons, "basicCoverage"),
             "loggage": self._generate_coverage_with_insured(insured_persons, "loggage"),
@@ -31,38 +55,38 @@ class TravelInsuranceGenerator(BaseGenerator):
 
     def _pick_example_or_faker(self, field_key, faker_func, *args, **kwargs):
         # Use example value with probability, fallback to Faker
-        values = self.field_profiles.get(field_key, [])
+        values = self.field_profiles.get(field_key)
         if values and random.random() < self.example_prob:
-            return random.choice(values)
+            return values[random.randrange(len(values))]
         return faker_func(*args, **kwargs)
 
     def _generate_travel_dates(self) -> dict:
-        today = datetime(2025, 7, 7)
         days_from_now = random.randint(1, 180)
-        start_date = today + timedelta(days=days_from_now)
         trip_duration = random.randint(2, 21)
-        end_date = start_date + timedelta(days=trip_duration)
+        start = _DAY_TABLE[days_from_now]
+        end = _DAY_TABLE[days_from_now + trip_duration]
         return {
-            "start_date": start_date.strftime("%d.%m.%Y"),
-            "end_date": end_date.strftime("%d.%m.%Y"),
-            "start_date_short": start_date.strftime("%d.%m.%y"),
-            "end_date_short": end_date.strftime("%d.%m.%y"),
-            "start_date_israeli": start_date.strftime("%d/%m/%Y"),
-            "end_date_israeli": end_date.strftime("%d/%m/%Y"),
-            "year": start_date.year,
-            "month": start_date.month,
-            "day": start_date.day,
-            "end_year": end_date.year,
-            "end_month": end_date.month,
-            "end_day": end_date.day,
+            "start_date": start[0],
+            "end_date": end[0],
+            "start_date_short": start[1],
+            "end_date_short": end[1],
+            "start_date_israeli": start[2],
+            "end_date_israeli": end[2],
+            "year": start[3],
+            "month": start[4],
+            "day": start[5],
+            "end_year": end[3],
+            "end_month": end[4],
+            "end_day": end[5],
             "trip_duration": trip_duration
         }
 
     def _generate_coverage_with_insured(self, insured_persons, coverage_type):
-        # Example-driven for allInsured
-        all_insured = self._pick_example_or_faker(f"response.response.{coverage_type}.allInsured", lambda: random.choice([True, False]))
+        # Example-driven for allInsured; both coins come from one draw
+        flags = random.getrandbits(2)
+        all_insured = self._pick_example_or_faker(f"response.response.{coverage_type}.allInsured", lambda: bool(flags & 2))
         return {
-            "insuredList": insured_persons if random.choice([True, False]) else None,
+            "insuredList": insured_persons if flags & 1 else None,
             "extraData": None,
             "allInsured": all_insured
         }
@@ -83,10 +107,7 @@ class TravelInsuranceGenerator(BaseGenerator):
 
     def _generate_mobile_phone_coverage_with_insured(self, insured_persons, coverage_type):
         insured_name = random.choice(insured_persons)
-        phone_models = [
-            "אייפון 15 פרו", "אייפון 14 פרו", "סמסונג גלקסי S24", "סמסונג גלקסי S23", "גוגל פיקסל 8", "OnePlus 11"
-        ]
-        model = self._pick_example_or_faker(f"response.response.{coverage_type}.extraData.model", lambda: random.choice(phone_models))
+        model = self._pick_example_or_faker(f"response.response.{coverage_type}.extraData.model", self._rand_phone)
         extra_data = [{
             "owner": insured_name,
             "model": model
@@ -100,10 +121,7 @@ class TravelInsuranceGenerator(BaseGenerator):
 
     def _generate_laptop_tablet_coverage_with_insured(self, insured_persons, coverage_type):
         insured_name = random.choice(insured_persons)
-        device_models = [
-            "MEC BOOK AIR", "MEC BOOK PRO", "iPad Pro", "iPad Air", "Surface Pro", "Dell XPS 13", "Lenovo ThinkPad"
-        ]
-        model = self._pick_example_or_faker(f"response.response.{coverage_type}.extraData.model", lambda: random.choice(device_models))
+        model = self._pick_example_or_faker(f"response.response.{coverage_type}.extraData.model", self._rand_device)
         extra_data = [{
             "owner": insured_name,
             "model": model
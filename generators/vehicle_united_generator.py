@@ -4,29 +4,134 @@ from config import Config
 import random
 from datetime import datetime, timedelta
 
+# Choice pools hoisted to module scope: the old call sites rebuilt the
+# list literal (and a lambda closure around it) on every record
+_VEHICLE_MODELS = (
+    'טויוטה קורולה', 'הונדה סיוויק', 'סוזוקי סוויפט', 'מיצובישי לאנסר', 'יונדאי I01 החדשה',
+    'יונדאי ERIPSNI  30-I', "פולקסווגן ג'טה מנג'ר 1600", 'ניסאן קשקאי החדשה אסנטה',
+    'מאזדה 3 אקטיב אוטו\' 4 דלתות', 'יונדאי 35IXPRIME', 'טסלהY DWR', 'BYD ATTO 3 COMFORT'
+)
+_INSURANCE_TYPES = ("מקיף + חובה", "ביטוח חובה", "ביטוח מקיף")
+_POLICY_SUBTYPES = ("makif", "hova")
+_PAY_METHODS = ("תשלום בכרטיס אשראי", "ויזה כ.א.ל 2666", "העברה בנקאית")
+_DETAIL_PAY_METHODS = ("תשלום בכרטיס אשראי", "ויזה כ.א.ל 2666")
+_POLICY_INSURANCE_TYPES = ("ביטוח חובה", "ביטוח מקיף")
+_POLICY_NAMES = ("ביטוח לרכב פרטי", "ביטוח חובה לרכב פרטי")
+_CLASSIFICATIONS = ("אישי", "עסקי", "משפחתי")
+
+# Small-range stringified ints drawn from pools instead of paying an
+# int-to-str conversion per record; the big-range ids keep f-strings
+_AGE_STRINGS = tuple(str(i) for i in range(18, 81))
+_SECTOR_STRINGS = tuple(str(i) for i in range(10, 1000))
+
+# Constant subtrees shared by reference across records; treat as
+# read-only — consumers serialize them without mutation
+_AGENT_DETAILS = [
+    {
+        "name": "הפניקס SMART",
+        "address": "דרך השלום 53 גבעתיים 53454",
+        "phone": "0778888888"
+    }
+]
+_SERVICE_LIST = [
+    {
+        "type": "גרירה",
+        "name": "שגריר",
+        "phone": "*8888",
+        "eSite": None
+    },
+    {
+        "type": "שמשות",
+        "name": "אוטוגלס",
+        "phone": "03-6507777",
+        "eSite": None
+    },
+    {
+        "type": "פנסים ומראות",
+        "name": "אוטוגלס",
+        "phone": "03-6507777",
+        "eSite": None
+    }
+]
+
+# Fixed anchor and precomputed deltas shared by every date build, matching
+# the _TODAY convention in the other generators
+_TODAY = datetime(2025, 7, 7)
+_DELTAS = tuple(timedelta(days=d) for d in range(181))
+_YEAR_DELTA = timedelta(days=364)
+
+# Only 180 distinct days_ago offsets exist, so each formatted date dict is
+# built once on first draw and reused; the cache caps at 180 entries
+_DATE_CACHE = {}
+
+
+def _build_dates(days_ago):
+    """Build the formatted date dict for a policy window starting days_ago back."""
+    start_date = _TODAY - _DELTAS[days_ago]
+    end_date = start_date + _YEAR_DELTA
+    return {
+        "start_date": start_date.strftime("%d.%m.%Y"),
+        "end_date": end_date.strftime("%d.%m.%Y"),
+        "start_date_short": start_date.strftime("%d.%m.%y"),
+        "end_date_short": end_date.strftime("%d.%m.%y"),
+        "start_date_israeli": start_date.strftime("%d/%m/%Y"),
+        "end_date_israeli": end_date.strftime("%d/%m/%Y"),
+        "original_start": start_date.strftime("%Y-%m-%dT00:00:00"),
+        "original_end": end_date.strftime("%Y-%m-%dT00:00:00"),
+        "year": start_date.year,
+        "month": start_date.month,
+        "day": start_date.day,
+        "end_year": end_date.year,
+        "end_month": end_date.month,
+        "end_day": end_date.day
+    }
+
+
 class VehicleUnitedGenerator(BaseGenerator):
     def __init__(self, faker: Faker, config: Config, field_profiles=None, example_prob=0.7):
         super().__init__(faker, config)
-        self.field_profiles = field_profiles or {}
+        profiles = {key: tuple(values) for key, values in (field_profiles or {}).items()}
+        self.field_profiles = profiles
         self.example_prob = example_prob
+        # Profile pools resolved once per dotted key here, so each record
+        # pays an attribute load instead of hashing a long key string
+        get = profiles.get
+        self._profile_model_type = get("response.data.modelType", ())
+        self._profile_insurance_type = get("response.data.insuranceType", ())
+        self._profile_policy_subtype = get("response.data.vehicleUnitedDetail.insuranceDetails.list.policySubType", ())
+        self._profile_pay_method = get("response.data.vehicleUnitedDetail.payments.payedList.list.method", ())
+        self._profile_detail_method = get("response.data.vehicleUnitedDetail.payments.payedList.list.details.method", ())
+        self._profile_detail_subtype = get("response.data.vehicleUnitedDetail.payments.payedList.list.details.policySubType", ())
+        self._profile_list_insurance_type = get("response.data.list.insuranceType", ())
+        self._profile_list_policy_name = get("response.data.list.policyName", ())
+        self._profile_list_classification = get("response.data.list.classification", ())
+        self._profile_list_car_policy_type = get("response.data.list.carPolicyType", ())
+        # Faker name lookups dominate the authorizedDrivers section; sampling
+        # from bounded pools built once is far cheaper and duplicate names
+        # are fine in mock data. Reading the property materializes a lazy
+        # Faker factory before the pools are drawn.
+        faker = self.faker
+        self._first_names = tuple(faker.first_name() for _ in range(1024))
+        self._last_names = tuple(faker.last_name() for _ in range(1024))
 
     def generate_record(self):
+        # Local bindings skip the module-attribute lookup per draw
+        randint = random.randint
         dates = self._generate_vehicle_dates()
-        vehicle_model = self._pick_example_or_faker("response.data.modelType", lambda: random.choice([
-            'טויוטה קורולה', 'הונדה סיוויק', 'סוזוקי סוויפט', 'מיצובישי לאנסר', 'יונדאי I01 החדשה',
-            'יונדאי ERIPSNI  30-I', "פולקסווגן ג'טה מנג'ר 1600", 'ניסאן קשקאי החדשה אסנטה',
-            'מאזדה 3 אקטיב אוטו\' 4 דלתות', 'יונדאי 35IXPRIME', 'טסלהY DWR', 'BYD ATTO 3 COMFORT'
-        ]))
-        license_plate = str(random.randint(1000000, 99999999))
+        vehicle_model = self._pick_from(self._profile_model_type, _VEHICLE_MODELS)
+        license_plate = f"{randint(1000000, 99999999)}"
         vehicle_united_detail = self._generate_vehicle_united_detail(dates, vehicle_model, license_plate)
-        policy_list = [self._generate_policy_item(dates, vehicle_model, license_plate) for _ in range(random.randint(1, 3))]
+        policy_list = [self._generate_policy_item(dates, vehicle_model, license_plate) for _ in range(randint(1, 3))]
+        # Both top-level coins from one draw instead of two choice([True,
+        # False]) calls that each rebuild the list literal
+        flags = random.getrandbits(2)
         record = {
             "vehicleUnitedDetail": vehicle_united_detail,
-            "insuranceType": self._pick_example_or_faker("response.data.insuranceType", lambda: random.choice(["מקיף + חובה", "ביטוח חובה", "ביטוח מקיף"])),
+            "insuranceType": self._pick_from(self._profile_insurance_type, _INSURANCE_TYPES),
             "modelType": vehicle_model,
             "licensePlate": license_plate,
-            "isExpired": random.choice([True, False]),
-            "isActive": random.choice([True, False]),
+            "isExpired": bool(flags & 1),
+            "isActive": bool(flags & 2),
             "list": policy_list
         }
         return record
@@ -34,42 +139,36 @@ class VehicleUnitedGenerator(BaseGenerator):
     def get_schema(self):
         return {"type": "object", "properties": {}}
 
-    def _pick_example_or_faker(self, field_key, faker_func, *args, **kwargs):
-        values = self.field_profiles.get(field_key, [])
-        if values and random.random() < self.example_prob:
-            return random.choice(values)
-        return faker_func(*args, **kwargs)
+    def _pick_from(self, values, defaults):
+        # values is the pre-resolved profile pool for the field (possibly
+        # empty); picking straight from tuples avoids a dict lookup and a
+        # lambda closure per field per record
+        pool = values if values and random.random() < self.example_prob else defaults
+        return pool[random.randrange(len(pool))]
 
     def _generate_vehicle_dates(self):
-        today = datetime(2025, 7, 7)
+        # The six strftime calls dominate this path; after the first draw
+        # of each offset this is a single dict lookup
         days_ago = random.randint(1, 180)
-        start_date = today - timedelta(days=days_ago)
-        end_date = start_date + timedelta(days=364)
-        return {
-            "start_date": start_date.strftime("%d.%m.%Y"),
-            "end_date": end_date.strftime("%d.%m.%Y"),
-            "start_date_short": start_date.strftime("%d.%m.%y"),
-            "end_date_short": end_date.strftime("%d.%m.%y"),
-            "start_date_israeli": start_date.strftime("%d/%m/%Y"),
-            "end_date_israeli": end_date.strftime("%d/%m/%Y"),
-            "year": start_date.year,
-            "month": start_date.month,
-            "day": start_date.day,
-            "end_year": end_date.year,
-            "end_month": end_date.month,
-            "end_day": end_date.day
-        }
+        dates = _DATE_CACHE.get(days_ago)
+        if dates is None:
+            dates = _DATE_CACHE[days_ago] = _build_dates(days_ago)
+        return dates
 
     def _generate_vehicle_united_detail(self, dates, vehicle_model, license_plate):
+        randint = random.randint
+        choice = random.choice
+        first_names = self._first_names
+        last_names = self._last_names
         return {
             "insuranceDetails": {
                 "updatedAt": dates["start_date_short"],
                 "startDate": dates["start_date_short"],
                 "endDate": dates["end_date_short"],
-                "originalEndDate": f"{dates['end_year']}-{dates['end_month']:02d}-{dates['end_day']:02d}T00:00:00",
-                "originalStartDate": f"{dates['year']}-{dates['month']:02d}-{dates['day']:02d}T00:00:00",
+                "originalEndDate": dates["original_end"],
+                "originalStartDate": dates["original_start"],
                 "premia": {
-                    "value": random.randint(1000, 10000),
+                    "value": randint(1000, 10000),
                     "currency": "₪"
                 },
                 "list": [
@@ -77,48 +176,48 @@ class VehicleUnitedGenerator(BaseGenerator):
                         "requiredRenewal": True,
                         "startDate": dates["start_date_short"],
                         "endDate": dates["end_date_short"],
-                        "policySubType": self._pick_example_or_faker("response.data.vehicleUnitedDetail.insuranceDetails.list.policySubType", lambda: random.choice(["makif", "hova"])),
+                        "policySubType": self._pick_from(self._profile_policy_subtype, _POLICY_SUBTYPES),
                         "premia": {
                             "currency": "₪",
-                            "value": random.randint(1000, 8000)
+                            "value": randint(1000, 8000)
                         },
                         "claimsList": [
                             {
-                                "claimNo": str(random.randint(1000000000, 9999999999)),
+                                "claimNo": f"{randint(1000000000, 9999999999)}",
                                 "submissionDate": dates["start_date_short"]
                             }
-                        ] if random.choice([True, False]) else []
+                        ] if random.getrandbits(1) else []
                     }
                 ]
             },
             "payments": {
                 "payedSum": {
-                    "value": random.randint(1000, 8000),
+                    "value": randint(1000, 8000),
                     "currency": "₪"
                 },
                 "balanceSum": {
-                    "value": random.randint(0, 3000),
+                    "value": randint(0, 3000),
                     "currency": "₪"
                 },
                 "payedList": {
                     "list": [
                         {
                             "date": dates["start_date_israeli"],
-                            "method": self._pick_example_or_faker("response.data.vehicleUnitedDetail.payments.payedList.list.method", lambda: random.choice(["תשלום בכרטיס אשראי", "ויזה כ.א.ל 2666", "העברה בנקאית"])),
+                            "method": self._pick_from(self._profile_pay_method, _PAY_METHODS),
                             "paymentType": "חיוב",
                             "amount": {
-                                "value": random.randint(100, 1000),
+                                "value": randint(100, 1000),
                                 "currency": "₪"
                             },
                             "details": [
                                 {
                                     "paymentNo": None,
                                     "date": dates["start_date_israeli"],
-                                    "method": self._pick_example_or_faker("response.data.vehicleUnitedDetail.payments.payedList.list.details.method", lambda: random.choice(["תשלום בכרטיס אשראי", "ויזה כ.א.ל 2666"])),
+                                    "method": self._pick_from(self._profile_detail_method, _DETAIL_PAY_METHODS),
                                     "totalPayments": "",
-                                    "policySubType": self._pick_example_or_faker("response.data.vehicleUnitedDetail.payments.payedList.list.details.policySubType", lambda: random.choice(["makif", "hova"])),
+                                    "policySubType": self._pick_from(self._profile_detail_subtype, _POLICY_SUBTYPES),
                                     "amount": {
-                                        "value": random.randint(100, 1000),
+                                        "value": randint(100, 1000),
                                         "currency": "₪"
                                     }
                                 }
@@ -127,63 +226,41 @@ class VehicleUnitedGenerator(BaseGenerator):
                     ]
                 }
             },
-            "agentDetails": [
-                {
-                    "name": "הפניקס SMART",
-                    "address": "דרך השלום 53 גבעתיים 53454",
-                    "phone": "0778888888"
-                }
-            ],
+            "agentDetails": _AGENT_DETAILS,
             "authorizedDrivers": [
                 {
-                    "firstName": self.faker.first_name(),
-                    "lastName": self.faker.last_name()
-                },
-                {
-                    "firstName": self.faker.first_name(),
-                    "lastName": self.faker.last_name()
-                }
-            ],
-            "serviceList": [
-                {
-                    "type": "גרירה",
-                    "name": "שגריר",
-                    "phone": "*8888",
-                    "eSite": None
-                },
-                {
-                    "type": "שמשות",
-                    "name": "אוטוגלס",
-                    "phone": "03-6507777",
-                    "eSite": None
+                    "firstName": choice(first_names),
+                    "lastName": choice(last_names)
                 },
                 {
-                    "type": "פנסים ומראות",
-                    "name": "אוטוגלס",
-                    "phone": "03-6507777",
-                    "eSite": None
+                    "firstName": choice(first_names),
+                    "lastName": choice(last_names)
                 }
             ],
+            "serviceList": _SERVICE_LIST,
             "treatmentSubjects": [],
             "licenseEndDate": dates["end_date_short"],
-            "youngerDriverAge": str(random.randint(18, 80))
+            "youngerDriverAge": choice(_AGE_STRINGS)
         }
 
     def _generate_policy_item(self, dates, vehicle_model, license_plate):
+        randint = random.randint
+        # One draw covers the three boolean fields below
+        flags = random.getrandbits(3)
         return {
-            "policyId": f"POL-{random.randint(100000, 999999)}",
-            "insuranceType": self._pick_example_or_faker("response.data.list.insuranceType", lambda: random.choice(["ביטוח חובה", "ביטוח מקיף"])),
-            "policyName": self._pick_example_or_faker("response.data.list.policyName", lambda: random.choice(["ביטוח לרכב פרטי", "ביטוח חובה לרכב פרטי"])),
+            "policyId": f"POL-{randint(100000, 999999)}",
+            "insuranceType": self._pick_from(self._profile_list_insurance_type, _POLICY_INSURANCE_TYPES),
+            "policyName": self._pick_from(self._profile_list_policy_name, _POLICY_NAMES),
             "endDate": dates["end_date"],
             "startDate": dates["start_date"],
             "modelType": vehicle_model,
             "licensePlate": license_plate,
-            "classification": self._pick_example_or_faker("response.data.list.classification", lambda: random.choice(["אישי", "עסקי", "משפחתי"])),
-            "carPolicyType": self._pick_example_or_faker("response.data.list.carPolicyType", lambda: random.choice(["makif", "hova"])),
-            "isExpired": random.choice([True, False]),
-            "isActive": random.choice([True, False]),
-            "sectorId": str(random.randint(10, 999)),
+            "classification": self._pick_from(self._profile_list_classification, _CLASSIFICATIONS),
+            "carPolicyType": self._pick_from(self._profile_list_car_policy_type, _POLICY_SUBTYPES),
+            "isExpired": bool(flags & 1),
+            "isActive": bool(flags & 2),
+            "sectorId": random.choice(_SECTOR_STRINGS),
             "validityTime": dates["start_date"],
-            "isSmart": random.choice([True, False]),
-            "AgentNumber": random.randint(10000, 99999)
+            "isSmart": bool(flags & 4),
+            "AgentNumber": randint(10000, 99999)
         } 
\ No newline at end of file
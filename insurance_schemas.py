@@ -1,244 +1,287 @@
-#!/usr/bin/env python3
-"""
-Insurance Type Schema Definitions
-
-This module defines the required fields, validation rules, and generation patterns
-for each insurance type based on the analysis of example data.
-"""
-
-from typing import Dict, List, Any, Set, Optional
-from dataclasses import dataclass
-from enum import Enum
-
-class FieldType(Enum):
-    """Field type enumeration for validation."""
-    STRING = "string"
-    INTEGER = "integer"
-    BOOLEAN = "boolean"
-    OBJECT = "object"
-    ARRAY = "array"
-    NULL = "null"
-
-@dataclass
-class FieldDefinition:
-    """Definition of a field with its type and requirements."""
-    field_type: FieldType
-    required: bool = True
-    default_value: Any = None
-    validation_rules: Optional[Dict[str, Any]] = None
-    generation_pattern: Optional[str] = None
-
-class InsuranceSchema:
-    """Schema definition for an insurance type."""
-    
-    def __init__(self, insurance_type: str, required_fields: Dict[str, FieldDefinition]):
-        self.insurance_type = insurance_type
-        self.required_fields = required_fields
-        self.optional_fields = {}
-    
-    def get_required_field_names(self) -> Set[str]:
-        """Get set of required field names."""
-        return {name for name, field in self.required_fields.items() if field.required}
-    
-    def validate_data(self, data: Dict[str, Any]) -> List[str]:
-        """Validate data against this schema and return list of errors."""
-        errors = []
-        
-        # Check required fields
-        for field_name, field_def in self.required_fields.items():
-            if field_def.required and field_name not in data:
-                errors.append(f"Missing required field: {field_name}")
-            elif field_name in data:
-                # Type validation
-                if not self._validate_field_type(data[field_name], field_def.field_type):
-                    errors.append(f"Invalid type for field {field_name}: expected {field_def.field_type.value}")
-        
-        return errors
-    
-    def _validate_field_type(self, value: Any, expected_type: FieldType) -> bool:
-        """Validate if a value matches the expected type."""
-        if value is None:
-            return expected_type == FieldType.NULL
-        elif expected_type == FieldType.STRING:
-            return isinstance(value, str)
-        elif expected_type == FieldType.INTEGER:
-            return isinstance(value, int)
-        elif expected_type == FieldType.BOOLEAN:
-            return isinstance(value, bool)
-        elif expected_type == FieldType.OBJECT:
-            return isinstance(value, dict)
-        elif expected_type == FieldType.ARRAY:
-            return isinstance(value, list)
-        return True
-
-# Define insurance type schemas based on analysis
-INSURANCE_SCHEMAS = {
-    "travel": InsuranceSchema("travel", {
-        # New complex coverage structure only
-        "basicCoverage": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_coverage"),
-        "loggage": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_coverage"),
-        "searchRescue": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_coverage"),
-        "corona": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_coverage"),
-        "extremeSport": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_extreme_sport"),
-        "mobilePhone": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_mobile_phone"),
-        "laptopOrTablet": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_laptop_tablet"),
-        "cancelOrDelay": FieldDefinition(FieldType.OBJECT, generation_pattern="travel_coverage"),
-    }),
-    
-    "vehicle": InsuranceSchema("vehicle", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "modelType": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_model"),
-        "licensePlate": FieldDefinition(FieldType.STRING, generation_pattern="license_plate"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "carPolicyType": FieldDefinition(FieldType.STRING, generation_pattern="car_policy_type"),
-        "sectorId": FieldDefinition(FieldType.STRING, generation_pattern="sector_id"),
-        "validityTime": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isSmart": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-    }),
-    
-    "health": InsuranceSchema("health", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="health_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="health_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "insuredName": FieldDefinition(FieldType.STRING, generation_pattern="name"),
-        "originalPolicyName": FieldDefinition(FieldType.STRING, generation_pattern="health_policy_name"),
-        "beneficiariesCount": FieldDefinition(FieldType.INTEGER, generation_pattern="beneficiaries_count"),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "isPaila": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-    }),
-    
-    "life": InsuranceSchema("life", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="life_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="life_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "insuredName": FieldDefinition(FieldType.STRING, generation_pattern="name"),
-        "originalPolicyName": FieldDefinition(FieldType.STRING, generation_pattern="life_policy_name"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "isKlasi": FieldDefinition(FieldType.BOOLEAN),
-        "isRiziko": FieldDefinition(FieldType.BOOLEAN),
-        "isCopyPolicyDoc": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-        "insuranceSum": FieldDefinition(FieldType.OBJECT, required=False),  # Can be null
-        "sum": FieldDefinition(FieldType.NULL, required=False),  # Usually null
-        "currency": FieldDefinition(FieldType.STRING, generation_pattern="currency"),
-        "value": FieldDefinition(FieldType.INTEGER, generation_pattern="insurance_value"),
-    }),
-    
-    "business": InsuranceSchema("business", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="business_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="business_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-    }),
-    
-    "dental": InsuranceSchema("dental", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="dental_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "insuredName": FieldDefinition(FieldType.STRING, generation_pattern="name"),
-        "originalPolicyName": FieldDefinition(FieldType.STRING, generation_pattern="dental_policy_name"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "beneficiariesCount": FieldDefinition(FieldType.INTEGER, generation_pattern="beneficiaries_count"),
-        "collectiveNumber": FieldDefinition(FieldType.STRING, generation_pattern="collective_number"),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-    }),
-    
-    "dira": InsuranceSchema("dira", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="dira_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="dira_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "address": FieldDefinition(FieldType.STRING, generation_pattern="address"),
-        "description": FieldDefinition(FieldType.STRING, generation_pattern="dira_description"),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "isSmart": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-    }),
-    
-    "other": InsuranceSchema("other", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="other_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="other_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "sectorId": FieldDefinition(FieldType.STRING, generation_pattern="sector_id"),
-        "validityTime": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-    }),
-    
-    # vehicleUnited is the most complex - it includes all vehicle fields plus nested structures
-    "vehicleUnited": InsuranceSchema("vehicleUnited", {
-        "policyId": FieldDefinition(FieldType.STRING, generation_pattern="policy_id"),
-        "insuranceType": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_insurance_type"),
-        "policyName": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_policy_name"),
-        "startDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "endDate": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "modelType": FieldDefinition(FieldType.STRING, generation_pattern="vehicle_model"),
-        "licensePlate": FieldDefinition(FieldType.STRING, generation_pattern="license_plate"),
-        "classification": FieldDefinition(FieldType.STRING, generation_pattern="classification"),
-        "carPolicyType": FieldDefinition(FieldType.STRING, generation_pattern="car_policy_type"),
-        "sectorId": FieldDefinition(FieldType.STRING, generation_pattern="sector_id"),
-        "validityTime": FieldDefinition(FieldType.STRING, generation_pattern="date"),
-        "isExpired": FieldDefinition(FieldType.BOOLEAN),
-        "isActive": FieldDefinition(FieldType.BOOLEAN),
-        "isSmart": FieldDefinition(FieldType.BOOLEAN),
-        "AgentNumber": FieldDefinition(FieldType.INTEGER, generation_pattern="agent_number"),
-        # Complex nested structures
-        "vehicleUnitedDetail": FieldDefinition(FieldType.OBJECT, required=True),
-        # Additional fields found in production
-        "list": FieldDefinition(FieldType.ARRAY, required=False),
-    }),
-    
-    # MyMoney unified schema for financial products (gemel, hishtalmut, gemelInvestment)
-    "mymoney": InsuranceSchema("mymoney", {
-        # Top header structure
-        "topHeader": FieldDefinition(FieldType.OBJECT, generation_pattern="mymoney_top_header"),
-        # Main header structure  
-        "mainHeader": FieldDefinition(FieldType.OBJECT, generation_pattern="mymoney_main_header"),
-        # Accumulation by product
-        "accumulationByProduct": FieldDefinition(FieldType.OBJECT, generation_pattern="mymoney_accumulation"),
-        # Product list with policies
-        "productList": FieldDefinition(FieldType.OBJECT, generation_pattern="mymoney_product_list"),
-        # Last actions
-        "lastActions": FieldDefinition(FieldType.OBJECT, generation_pattern="mymoney_last_actions"),
-    }),
-}
-
-def get_schema(insurance_type: str) -> Optional[InsuranceSchema]:
-    """Get schema for a specific insurance type."""
-    return INSURANCE_SCHEMAS.get(insurance_type)
-
-def get_available_insurance_types() -> List[str]:
-    """Get list of all available insurance types."""
-    return list(INSURANCE_SCHEMAS.keys())
-
-def validate_insurance_data(insurance_type: str, data: Dict[str, Any]) -> List[str]:
-    """Validate insurance data against its schema."""
-    schema = get_schema(insurance_type)
-    if not schema:
-        return [f"Unknown insurance type: {insurance_type}"]
-    
+#!/usr/bin/env python3
+"""
+Insurance Type Schema Definitions
+
+This module defines the required fields, validation rules, and generation patterns
+for each insurance type based on the analysis of example data.
+"""
+
+from typing import Dict, FrozenSet, List, Any, Optional
+from dataclasses import dataclass
+from enum import Enum
+
+class FieldType(Enum):
+    """Field type enumeration for validation."""
+    STRING = "string"
+    INTEGER = "integer"
+    BOOLEAN = "boolean"
+    OBJECT = "object"
+    ARRAY = "array"
+    NULL = "null"
+
+@dataclass(frozen=True, slots=True)
+class FieldDefinition:
+    """Definition of a field with its type and requirements."""
+    field_type: FieldType
+    required: bool = True
+    default_value: Any = None
+    validation_rules: Optional[Dict[str, Any]] = None
+    generation_pattern: Optional[str] = None
+
+# Many definitions repeat verbatim across the schema table (e.g. a
+# required STRING with the "date" pattern); the interning constructor
+# collapses them to shared instances
+_FD_CACHE: Dict[tuple, FieldDefinition] = {}
+
+def _fd(*args, **kwargs) -> FieldDefinition:
+    """Interning FieldDefinition constructor for the schema table."""
+    key = (args, tuple(sorted(kwargs.items())))
+    field_def = _FD_CACHE.get(key)
+    if field_def is None:
+        field_def = _FD_CACHE[key] = FieldDefinition(*args, **kwargs)
+    return field_def
+
+# Concrete type per FieldType, shared by the compiled validators and
+# _validate_field_type; NULL is absent because the current semantics
+# accept any value (including None) for it
+_TYPE_CHECK = {
+    FieldType.STRING: str,
+    FieldType.INTEGER: int,
+    FieldType.BOOLEAN: bool,
+    FieldType.OBJECT: dict,
+    FieldType.ARRAY: list,
+}
+
+class InsuranceSchema:
+    """Schema definition for an insurance type."""
+
+    def __init__(self, insurance_type: str, required_fields: Dict[str, FieldDefinition]):
+        self.insurance_type = insurance_type
+        self.required_fields = required_fields
+        self.optional_fields = {}
+        self._validator = self._compile_validator()
+        # required_fields never changes after construction, so the name set
+        # is computed once; frozenset keeps callers from mutating it
+        self._required_names = frozenset(
+            name for name, field in required_fields.items() if field.required
+        )
+
+    def _compile_validator(self):
+        """
+        Compile this schema into a flat validator function.
+
+        The fields are fixed at construction, so the per-field dict
+        iteration and type dispatch of the generic loop are specialized
+        away into straight-line membership and isinstance checks.
+        """
+        lines = ["def _validate(data, errors):"]
+        for field_name, field_def in self.required_fields.items():
+            key = repr(field_name)
+            check = _TYPE_CHECK.get(field_def.field_type)
+            check = check.__name__ if check else None
+            type_error = repr(
+                f"Invalid type for field {field_name}: expected {field_def.field_type.value}"
+            )
+            if field_def.required:
+                lines.append(f"    if {key} not in data:")
+                lines.append(f"        errors.append({f'Missing required field: {field_name}'!r})")
+                if check:
+                    lines.append(f"    elif not isinstance(data[{key}], {check}):")
+                    lines.append(f"        errors.append({type_error})")
+            elif check:
+                lines.append(f"    if {key} in data and not isinstance(data[{key}], {check}):")
+                lines.append(f"        errors.append({type_error})")
+        if len(lines) == 1:
+            lines.append("    pass")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace["_validate"]
+
+    def get_required_field_names(self) -> FrozenSet[str]:
+        """Get set of required field names."""
+        return self._required_names
+
+    def validate_data(self, data: Dict[str, Any]) -> List[str]:
+        """Validate data against this schema and return list of errors."""
+        errors = []
+        self._validator(data, errors)
+        return errors
+    
+    def _validate_field_type(self, value: Any, expected_type: FieldType) -> bool:
+        """Validate if a value matches the expected type."""
+        if value is None:
+            return expected_type == FieldType.NULL
+        expected = _TYPE_CHECK.get(expected_type)
+        return expected is None or isinstance(value, expected)
+
+# Define insurance type schemas based on analysis
+INSURANCE_SCHEMAS = {
+    "travel": InsuranceSchema("travel", {
+        # New complex coverage structure only
+        "basicCoverage": _fd(FieldType.OBJECT, generation_pattern="travel_coverage"),
+        "loggage": _fd(FieldType.OBJECT, generation_pattern="travel_coverage"),
+        "searchRescue": _fd(FieldType.OBJECT, generation_pattern="travel_coverage"),
+        "corona": _fd(FieldType.OBJECT, generation_pattern="travel_coverage"),
+        "extremeSport": _fd(FieldType.OBJECT, generation_pattern="travel_extreme_sport"),
+        "mobilePhone": _fd(FieldType.OBJECT, generation_pattern="travel_mobile_phone"),
+        "laptopOrTablet": _fd(FieldType.OBJECT, generation_pattern="travel_laptop_tablet"),
+        "cancelOrDelay": _fd(FieldType.OBJECT, generation_pattern="travel_coverage"),
+    }),
+    
+    "vehicle": InsuranceSchema("vehicle", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="vehicle_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="vehicle_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "modelType": _fd(FieldType.STRING, generation_pattern="vehicle_model"),
+        "licensePlate": _fd(FieldType.STRING, generation_pattern="license_plate"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "carPolicyType": _fd(FieldType.STRING, generation_pattern="car_policy_type"),
+        "sectorId": _fd(FieldType.STRING, generation_pattern="sector_id"),
+        "validityTime": _fd(FieldType.STRING, generation_pattern="date"),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isSmart": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+    }),
+    
+    "health": InsuranceSchema("health", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="health_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="health_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "insuredName": _fd(FieldType.STRING, generation_pattern="name"),
+        "originalPolicyName": _fd(FieldType.STRING, generation_pattern="health_policy_name"),
+        "beneficiariesCount": _fd(FieldType.INTEGER, generation_pattern="beneficiaries_count"),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "isPaila": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+    }),
+    
+    "life": InsuranceSchema("life", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="life_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="life_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "insuredName": _fd(FieldType.STRING, generation_pattern="name"),
+        "originalPolicyName": _fd(FieldType.STRING, generation_pattern="life_policy_name"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "isKlasi": _fd(FieldType.BOOLEAN),
+        "isRiziko": _fd(FieldType.BOOLEAN),
+        "isCopyPolicyDoc": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+        "insuranceSum": _fd(FieldType.OBJECT, required=False),  # Can be null
+        "sum": _fd(FieldType.NULL, required=False),  # Usually null
+        "currency": _fd(FieldType.STRING, generation_pattern="currency"),
+        "value": _fd(FieldType.INTEGER, generation_pattern="insurance_value"),
+    }),
+    
+    "business": InsuranceSchema("business", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="business_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="business_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+    }),
+    
+    "dental": InsuranceSchema("dental", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="dental_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "insuredName": _fd(FieldType.STRING, generation_pattern="name"),
+        "originalPolicyName": _fd(FieldType.STRING, generation_pattern="dental_policy_name"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "beneficiariesCount": _fd(FieldType.INTEGER, generation_pattern="beneficiaries_count"),
+        "collectiveNumber": _fd(FieldType.STRING, generation_pattern="collective_number"),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isExpired": _fd(FieldType.BOOLEAN),
+    }),
+    
+    "dira": InsuranceSchema("dira", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="dira_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="dira_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "address": _fd(FieldType.STRING, generation_pattern="address"),
+        "description": _fd(FieldType.STRING, generation_pattern="dira_description"),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "isSmart": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+    }),
+    
+    "other": InsuranceSchema("other", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="other_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="other_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "sectorId": _fd(FieldType.STRING, generation_pattern="sector_id"),
+        "validityTime": _fd(FieldType.STRING, generation_pattern="date"),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+    }),
+    
+    # vehicleUnited is the most complex - it includes all vehicle fields plus nested structures
+    "vehicleUnited": InsuranceSchema("vehicleUnited", {
+        "policyId": _fd(FieldType.STRING, generation_pattern="policy_id"),
+        "insuranceType": _fd(FieldType.STRING, generation_pattern="vehicle_insurance_type"),
+        "policyName": _fd(FieldType.STRING, generation_pattern="vehicle_policy_name"),
+        "startDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "endDate": _fd(FieldType.STRING, generation_pattern="date"),
+        "modelType": _fd(FieldType.STRING, generation_pattern="vehicle_model"),
+        "licensePlate": _fd(FieldType.STRING, generation_pattern="license_plate"),
+        "classification": _fd(FieldType.STRING, generation_pattern="classification"),
+        "carPolicyType": _fd(FieldType.STRING, generation_pattern="car_policy_type"),
+        "sectorId": _fd(FieldType.STRING, generation_pattern="sector_id"),
+        "validityTime": _fd(FieldType.STRING, generation_pattern="date"),
+        "isExpired": _fd(FieldType.BOOLEAN),
+        "isActive": _fd(FieldType.BOOLEAN),
+        "isSmart": _fd(FieldType.BOOLEAN),
+        "AgentNumber": _fd(FieldType.INTEGER, generation_pattern="agent_number"),
+        # Complex nested structures
+        "vehicleUnitedDetail": _fd(FieldType.OBJECT, required=True),
+        # Additional fields found in production
+        "list": _fd(FieldType.ARRAY, required=False),
+    }),
+    
+    # MyMoney unified schema for financial products (gemel, hishtalmut, gemelInvestment)
+    "mymoney": InsuranceSchema("mymoney", {
+        # Top header structure
+        "topHeader": _fd(FieldType.OBJECT, generation_pattern="mymoney_top_header"),
+        # Main header structure  
+        "mainHeader": _fd(FieldType.OBJECT, generation_pattern="mymoney_main_header"),
+        # Accumulation by product
+        "accumulationByProduct": _fd(FieldType.OBJECT, generation_pattern="mymoney_accumulation"),
+        # Product list with policies
+        "productList": _fd(FieldType.OBJECT, generation_pattern="mymoney_product_list"),
+        # Last actions
+        "lastActions": _fd(FieldType.OBJECT, generation_pattern="mymoney_last_actions"),
+    }),
+}
+
+def get_schema(insurance_type: str) -> Optional[InsuranceSchema]:
+    """Get schema for a specific insurance type."""
+    return INSURANCE_SCHEMAS.get(insurance_type)
+
+def get_available_insurance_types() -> List[str]:
+    """Get list of all available insurance types."""
+    return list(INSURANCE_SCHEMAS.keys())
+
+def validate_insurance_data(insurance_type: str, data: Dict[str, Any]) -> List[str]:
+    """Validate insurance data against its schema."""
+    schema = get_schema(insurance_type)
+    if not schema:
+        return [f"Unknown insurance type: {insurance_type}"]
+    
     return schema.validate_data(data) 
\ No newline at end of file
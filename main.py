@@ -1,15 +1,44 @@
 import argparse
-from config import Config
-from commands.generator_context import GeneratorContext
-from commands.generate_command import GenerateCommand
-from commands.list_types_command import ListTypesCommand
-from factories.generator_factory import GeneratorFactory
-from example_analyzer import analyze_examples, summarize_examples
-import glob
 import os
-import yaml
 import random
 
+import orjson
+
+from config import Config
+
+# The command, factory and analyzer modules (and yaml) are imported inside
+# the paths that use them: flag-only invocations like --list-preserve-fields
+# then skip loading Faker and the generator stack entirely. sys.modules
+# makes the repeated function-local imports free after the first one.
+
+
+def dump_json(obj, path):
+    # orjson serializes in C and the indented bytes go out in one write,
+    # instead of json.dump's per-element pure-Python indent path
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def save_config_to_yaml(cfg, path):
+    import tempfile
+    import yaml
+    # libyaml's C dumper emits the file several times faster than the
+    # pure-Python SafeDumper; fall back when PyYAML lacks the bindings
+    try:
+        from yaml import CSafeDumper as _Dumper
+    except ImportError:
+        from yaml import SafeDumper as _Dumper
+    # Write to a sibling temp file and swap it in, so a crash mid-dump
+    # never leaves a truncated config.yaml behind
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(cfg.to_dict(), f, Dumper=_Dumper, allow_unicode=True, sort_keys=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 def get_output_path(insurance_type, output_file=None):
     base_dir = os.path.join("data", "mock_output", insurance_type)
@@ -29,25 +58,32 @@ def save_records_separately(records, insurance_type):
         # Generate a unique 9-digit ID
         file_id = str(random.randint(100000000, 999999999))
         file_path = os.path.join(base_dir, f"{file_id}.json")
-        with open(file_path, "w", encoding="utf-8") as f:
-            import json
-            json.dump(record, f, ensure_ascii=False, indent=2)
+        dump_json(record, file_path)
         filenames.append(file_path)
     return filenames
 
 
 def interactive_menu():
+    from commands.generator_context import GeneratorContext
+    from commands.generate_command import GenerateCommand
+    from commands.list_types_command import ListTypesCommand
+    from factories.generator_factory import GeneratorFactory
+    from example_analyzer import analyze_examples, summarize_examples
+
     config_path = "config.yaml"
     config = Config.from_yaml_file(config_path) if os.path.exists(config_path) else Config()
-    example_files = glob.glob("data/examples/*.json")
     field_profiles = analyze_examples("data/examples/")
     factory = GeneratorFactory(config, field_profiles)
     context = GeneratorContext(config)
     context.factory = factory
+    # The available types only change when the config does, so the command
+    # output is cached on the context and dropped on config edits
+    context._types_cache = None
 
-    def save_config_to_yaml(cfg, path):
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(cfg.to_dict(), f, allow_unicode=True, sort_keys=False)
+    def list_types():
+        if context._types_cache is None:
+            context._types_cache = ListTypesCommand().execute(context)
+        return context._types_cache
 
     while True:
         print("\n=== Mock Insurance Data Generator ===")
@@ -58,8 +94,7 @@ def interactive_menu():
         print("5. Exit")
         choice = input("Select an option (1-5): ").strip()
         if choice == "1":
-            types_command = ListTypesCommand()
-            types = types_command.execute(context)
+            types = list_types()
             print("\nAvailable types:")
             for idx, t in enumerate(types, 1):
                 print(f"{idx}. {t['insurance_type']}")
@@ -80,22 +115,22 @@ def interactive_menu():
             except Exception as e:
                 print(f"Error: {e}")
                 continue
-            import json
             if separate_files:
                 filenames = save_records_separately(records, insurance_type)
                 print(f"Saved {len(filenames)} records to {os.path.join('data', 'mock_output', insurance_type)}/ as separate files.")
             else:
                 output_path = get_output_path(insurance_type, output_file if output_file else None)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(records, f, ensure_ascii=False, indent=2)
+                dump_json(records, output_path)
                 print(f"Generated records saved to {output_path}")
         elif choice == "2":
-            types_command = ListTypesCommand()
-            types = types_command.execute(context)
+            types = list_types()
             print("\nAvailable types:")
             for t in types:
                 print(f"- {t['insurance_type']}")
         elif choice == "3":
+            # Edits accumulate in memory and the YAML is rewritten once on
+            # leaving the submenu, not per add/remove
+            dirty = False
             while True:
                 print("\n--- Manage Preserve Fields ---")
                 print("1. List Preserve Fields")
@@ -110,14 +145,19 @@ def interactive_menu():
                 elif pf_choice == "2":
                     field = input("Enter field name to add: ").strip()
                     config.add_preserve_field(field)
-                    save_config_to_yaml(config, config_path)
+                    dirty = True
+                    context._types_cache = None
                     print(f"Added '{field}' to preserve fields.")
                 elif pf_choice == "3":
                     field = input("Enter field name to remove: ").strip()
                     config.remove_preserve_field(field)
-                    save_config_to_yaml(config, config_path)
+                    dirty = True
+                    context._types_cache = None
                     print(f"Removed '{field}' from preserve fields.")
                 elif pf_choice == "4":
+                    if dirty:
+                        save_config_to_yaml(config, config_path)
+                        print("Preserve fields saved.")
                     break
                 else:
                     print("Invalid selection.")
@@ -136,9 +176,7 @@ def interactive_menu():
             save_json = input("Save this summary as JSON? (y/n): ").strip().lower()
             if save_json == "y":
                 json_file = input("Enter filename (e.g., example_report.json): ").strip()
-                import json
-                with open(json_file, "w", encoding="utf-8") as f:
-                    json.dump(summary, f, ensure_ascii=False, indent=2)
+                dump_json(summary, json_file)
                 print(f"Summary saved to {json_file}")
         elif choice == "5":
             print("Goodbye!")
@@ -170,6 +208,7 @@ def main():
 
     # Example analysis/reporting
     if args.analyze_examples or args.analyze_examples_json:
+        from example_analyzer import summarize_examples
         summary = summarize_examples("data/examples/")
         if args.analyze_examples:
             print("Insurance types found:")
@@ -183,9 +222,7 @@ def main():
             for k, v in list(summary["value_distributions"].items())[:10]:
                 print(f"- {k}: {v}")
         if args.analyze_examples_json:
-            import json
-            with open(args.analyze_examples_json, "w", encoding="utf-8") as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            dump_json(summary, args.analyze_examples_json)
             print(f"\nSummary saved to {args.analyze_examples_json}")
         return
 
@@ -196,11 +233,6 @@ def main():
     else:
         config = Config()
 
-    # Helper to save config back to YAML
-    def save_config_to_yaml(cfg, path):
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(cfg.to_dict(), f, allow_unicode=True, sort_keys=False)
-
     # Handle preserve fields CLI options
     if args.list_preserve_fields:
         print("Current preserve fields:")
@@ -208,24 +240,40 @@ def main():
             print(f"- {field}")
         return
     if args.add_preserve_field:
+        # The YAML rewrite dominates this command; skip it when the field
+        # was already present
+        before = frozenset(config.list_preserve_fields())
         config.add_preserve_field(args.add_preserve_field)
-        print(f"Added '{args.add_preserve_field}' to preserve fields.")
-        save_config_to_yaml(config, config_path)
+        if frozenset(config.list_preserve_fields()) != before:
+            print(f"Added '{args.add_preserve_field}' to preserve fields.")
+            save_config_to_yaml(config, config_path)
+        else:
+            print(f"'{args.add_preserve_field}' is already a preserve field (no change).")
         print("Updated preserve fields:")
         for field in sorted(config.list_preserve_fields()):
             print(f"- {field}")
         return
     if args.remove_preserve_field:
+        before = frozenset(config.list_preserve_fields())
         config.remove_preserve_field(args.remove_preserve_field)
-        print(f"Removed '{args.remove_preserve_field}' from preserve fields.")
-        save_config_to_yaml(config, config_path)
+        if frozenset(config.list_preserve_fields()) != before:
+            print(f"Removed '{args.remove_preserve_field}' from preserve fields.")
+            save_config_to_yaml(config, config_path)
+        else:
+            print(f"'{args.remove_preserve_field}' is not a preserve field (no change).")
         print("Updated preserve fields:")
         for field in sorted(config.list_preserve_fields()):
             print(f"- {field}")
         return
 
+    # The generator stack is only needed past this point
+    from commands.generator_context import GeneratorContext
+    from commands.generate_command import GenerateCommand
+    from commands.list_types_command import ListTypesCommand
+    from factories.generator_factory import GeneratorFactory
+    from example_analyzer import analyze_examples
+
     # Analyze example files for field profiles
-    example_files = glob.glob("data/examples/*.json")
     field_profiles = analyze_examples("data/examples/")
     # Pass field_profiles to factory and context
     factory = GeneratorFactory(config, field_profiles)
@@ -247,14 +295,12 @@ def main():
         except Exception as e:
             print(f"Error: {e}")
             return
-        import json
         if args.separate_files:
             filenames = save_records_separately(records, args.type)
             print(f"Saved {len(filenames)} records to data/mock_output/{args.type}/ as separate files.")
         else:
             output_path = get_output_path(args.type, args.output if args.output else None)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(records, f, ensure_ascii=False, indent=2)
+            dump_json(records, output_path)
             print(f"Generated records saved to {output_path}")
         return
 